@@ -1,13 +1,16 @@
 import os
 from pathlib import Path
-from dotenv import load_dotenv
+from types import MappingProxyType
+from dotenv import dotenv_values
 
 # Try to load .env.canton
 env_path = Path(".env.canton")
 if env_path.exists():
     print("✓ Found .env.canton")
-    load_dotenv(env_path)
-    key = os.getenv("ANTHROPIC_API_KEY", "")
+    # Parse once into a read-only snapshot (system environment takes precedence)
+    file_values = {k: v for k, v in dotenv_values(env_path).items() if v is not None}
+    ENV = MappingProxyType({**file_values, **os.environ})
+    key = ENV.get("ANTHROPIC_API_KEY", "")
     if key:
         print(f"✓ ANTHROPIC_API_KEY is set (length: {len(key)} chars)")
         print(f"  Starts with: {key[:10]}..." if len(key) > 10 else f"  Full: {key}")
@@ -15,6 +18,6 @@ if env_path.exists():
         print("✗ ANTHROPIC_API_KEY is empty or not set")
     
     # Check other relevant vars
-    print(f"\nENABLE_LLM_AUTH_EXTRACTION: {os.getenv('ENABLE_LLM_AUTH_EXTRACTION', 'not set')}")
+    print(f"\nENABLE_LLM_AUTH_EXTRACTION: {ENV.get('ENABLE_LLM_AUTH_EXTRACTION', 'not set')}")
 else:
     print("✗ .env.canton not found")
@@ -6,10 +6,11 @@ Test and interact with Git-verified MCP resources
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
+import orjson
+
 def test_resources_list():
     """Test the resources/list endpoint"""
     print("Testing resources/list endpoint...")
@@ -22,24 +23,26 @@ def test_resources_list():
         # Call the handler
         result = handle_resources_list()
         
-        print(f"✅ Found {len(result.resources)} Git-verified resources:")
-        print()
+        # Build the whole listing and write it once instead of a print() per line
+        lines = [f"✅ Found {len(result.resources)} Git-verified resources:", ""]
+        separator = "-" * 40
         
         for resource in result.resources:
-            print(f"URI: {resource.uri}")
-            print(f"Name: {resource.name}")
-            print(f"Description: {resource.description}")
+            lines.append(f"URI: {resource.uri}")
+            lines.append(f"Name: {resource.name}")
+            lines.append(f"Description: {resource.description}")
             
             if hasattr(resource, '_meta') and resource._meta:
                 meta = resource._meta
-                print(f"Git Hash: {meta.get('canonical_hash', 'unknown')}")
-                print(f"Source Commit: {meta.get('source_commit', 'unknown')}")
-                print(f"Source File: {meta.get('source_file', 'unknown')}")
-                print(f"Extracted At: {meta.get('extracted_at', 'unknown')}")
-                print(f"Git Verified: {meta.get('git_verified', False)}")
+                lines.append(f"Git Hash: {meta.get('canonical_hash', 'unknown')}")
+                lines.append(f"Source Commit: {meta.get('source_commit', 'unknown')}")
+                lines.append(f"Source File: {meta.get('source_file', 'unknown')}")
+                lines.append(f"Extracted At: {meta.get('extracted_at', 'unknown')}")
+                lines.append(f"Git Verified: {meta.get('git_verified', False)}")
             
-            print("-" * 40)
+            lines.append(separator)
         
+        sys.stdout.write("\n".join(lines) + "\n")
         return True
         
     except Exception as e:
@@ -62,10 +65,10 @@ def test_resources_read(uri: str):
         print()
         
         # Parse and display content
-        content = json.loads(result.contents[0].text)
+        content = orjson.loads(result.contents[0].text)
         
         print("Resource Content:")
-        print(json.dumps(content, indent=2))
+        print(orjson.dumps(content, option=orjson.OPT_INDENT_2).decode())
         
         return True
         
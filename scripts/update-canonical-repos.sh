@@ -21,11 +21,18 @@ for repo in "${REPOS[@]}"; do
     echo "📦 Updating $repo..."
     cd "$repo"
     
+    OLD_COMMIT=$(git rev-parse HEAD)
+    
+    # Ask the remote for its main SHA first (one round-trip, no objects)
+    # and skip the fetch entirely when we already have it checked out
+    REMOTE_COMMIT=$(git ls-remote origin refs/heads/main | cut -f1)
+    if [ -n "$REMOTE_COMMIT" ] && [ "$REMOTE_COMMIT" = "$OLD_COMMIT" ]; then
+      echo "   ✅ Already up to date ($OLD_COMMIT)"
+      continue
+    fi
+    
     # Fetch latest changes
     git fetch origin
-    
-    # Get current and new commit
-    OLD_COMMIT=$(git rev-parse HEAD)
     git reset --hard origin/main
     NEW_COMMIT=$(git rev-parse HEAD)
     
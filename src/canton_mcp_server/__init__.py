@@ -2,6 +2,14 @@
 Canton MCP Server - A FastMCP server for Canton blockchain development.
 """
 
-from .server import app
-
 __all__ = ["app"]
+
+
+def __getattr__(name: str):
+    # Import the FastAPI app lazily so submodules (core, daml, cli) can be
+    # imported without pulling in the whole server stack
+    if name == "app":
+        from .server import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
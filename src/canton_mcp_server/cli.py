@@ -2,10 +2,7 @@
 Canton MCP Server CLI entry point.
 """
 
-import uvicorn
-
 from .env import get_env
-from .server import app
 
 
 def main():
@@ -15,7 +12,12 @@ def main():
     print(f"  Canton MCP Server v0.1 | {mcp_server_url}/mcp")
     print("  DAML Validation & Authorization Patterns")
     print("─" * 60 + "\n")
-    
+
+    # Heavy imports (uvicorn, FastAPI app and all tools) only when serving
+    import uvicorn
+
+    from .server import app
+
     uvicorn.run(
         app,
         host="0.0.0.0",
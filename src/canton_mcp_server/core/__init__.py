@@ -40,18 +40,6 @@ from .pricing import PricingType, ToolPricing
 # Registry
 from .registry import ToolNotFoundError, get_registry, register_tool
 
-# Request management
-from .request_manager import RequestManager
-
-# MCP Protocol Responses (factories)
-from .responses import (
-    ErrorCodes,
-    NotificationResponse,
-    PromptResponse,
-    ResourceResponse,
-    Response,
-)
-
 # Type definitions
 from .types import (
     ToolResponse,  # Type alias: Union[JSONRPCResponse, JSONRPCNotification]
@@ -90,3 +78,30 @@ __all__ = [
     "NotificationResponse",
 ]
 
+# Rarely used re-exports, imported on first attribute access (PEP 562) so
+# that ``from canton_mcp_server.core import Tool`` stays cheap
+_LAZY_EXPORTS = {
+    "RequestManager": ".request_manager",
+    "Response": ".responses",
+    "ErrorCodes": ".responses",
+    "ResourceResponse": ".responses",
+    "PromptResponse": ".responses",
+    "NotificationResponse": ".responses",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
+
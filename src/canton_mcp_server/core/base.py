@@ -9,13 +9,25 @@ All tools must inherit from Tool and implement the execute() method.
 """
 
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Generic, Optional, Type
+from functools import lru_cache
+from typing import AsyncGenerator, ClassVar, Generic, Optional, Type
 
 from .context import ToolContext
 from .pricing import ToolPricing
 from .types import ToolResponse, TParams, TResult
 
 
+@lru_cache(maxsize=None)
+def _schema_for(model_cls: type) -> dict:
+    """
+    Return the JSON schema for a Pydantic model class, computed once.
+
+    Keyed on the class object so tools that share a params/result model also
+    share its schema. The returned dict is shared; callers must not mutate it.
+    """
+    return model_cls.model_json_schema()
+
+
 class Tool(ABC, Generic[TParams, TResult]):
     """
     Abstract base class for all MCP tools.
@@ -52,6 +64,10 @@ class Tool(ABC, Generic[TParams, TResult]):
     # Pricing configuration (optional, defaults to FREE)
     pricing: Optional["ToolPricing"] = None
 
+    # Per-subclass schema caches (populated on first tools/list)
+    _cached_input_schema: ClassVar[Optional[dict]] = None
+    _cached_output_schema: ClassVar[Optional[dict]] = None
+
     def __init__(self):
         """Initialize tool with default free pricing if not specified"""
         if self.pricing is None:
@@ -136,26 +152,35 @@ class Tool(ABC, Generic[TParams, TResult]):
         Generate JSON schema for tool input parameters.
 
         Automatically generates schema from the Pydantic params_model.
-        This is used for MCP tools/list response.
+        This is used for MCP tools/list response. The schema is computed once
+        per tool class and shared; callers must not mutate it.
 
         Returns:
             JSON schema dict compatible with MCP protocol
         """
-        return self.params_model.model_json_schema()
+        cls = type(self)
+        if "_cached_input_schema" not in cls.__dict__:
+            cls._cached_input_schema = _schema_for(self.params_model)
+        return cls._cached_input_schema
 
     def get_output_schema(self) -> Optional[dict]:
         """
         Generate JSON schema for tool output (if result_model defined).
 
         Returns inlined schema without $defs and $ref for MCP compliance.
+        The schema is computed once per tool class and shared; callers must
+        not mutate it.
 
         Returns:
             JSON schema dict or None if no result_model specified
         """
-        if self.result_model and hasattr(self.result_model, "model_json_schema"):
-            schema = self.result_model.model_json_schema()
-            return self._inline_schema_refs(schema)
-        return None
+        cls = type(self)
+        if "_cached_output_schema" not in cls.__dict__:
+            schema = None
+            if self.result_model and hasattr(self.result_model, "model_json_schema"):
+                schema = self._inline_schema_refs(_schema_for(self.result_model))
+            cls._cached_output_schema = schema
+        return cls._cached_output_schema
 
     @staticmethod
     def _inline_schema_refs(schema: dict) -> dict:
@@ -169,15 +194,26 @@ class Tool(ABC, Generic[TParams, TResult]):
             schema: JSON schema with potential $defs and $ref
 
         Returns:
-            Inlined JSON schema without $defs or $ref
+            Inlined JSON schema without $defs or $ref. Schemas without $defs
+            have nothing to inline and are returned as-is (not copied).
         """
-        import copy
-
-        schema = copy.deepcopy(schema)
-        defs = schema.pop("$defs", {})
+        defs = schema.get("$defs")
+        if not defs:
+            # Fast path: no definitions means no resolvable refs
+            if defs is None:
+                return schema
+            return {k: v for k, v in schema.items() if k != "$defs"}
+
+        def clone(obj):
+            """Copy a plain JSON value (dicts/lists are the only mutable types)"""
+            if isinstance(obj, dict):
+                return {k: clone(v) for k, v in obj.items()}
+            elif isinstance(obj, list):
+                return [clone(item) for item in obj]
+            return obj
 
-        def resolve_ref(obj: dict, defs: dict) -> dict:
-            """Recursively resolve $ref references"""
+        def resolve_ref(obj):
+            """Recursively resolve $ref references, copying as it goes"""
             if isinstance(obj, dict):
                 if "$ref" in obj:
                     # Extract reference path (e.g., "#/$defs/BacktestResult")
@@ -185,18 +221,18 @@ class Tool(ABC, Generic[TParams, TResult]):
                     if ref_path.startswith("#/$defs/"):
                         def_name = ref_path.split("/")[-1]
                         if def_name in defs:
-                            # Replace $ref with actual definition
-                            resolved = copy.deepcopy(defs[def_name])
-                            # Recursively resolve nested refs
-                            return resolve_ref(resolved, defs)
-                    return obj
+                            # Replace $ref with actual definition, resolving nested refs
+                            return resolve_ref(defs[def_name])
+                    return clone(obj)
                 else:
                     # Recursively process nested objects
-                    return {k: resolve_ref(v, defs) for k, v in obj.items()}
+                    return {k: resolve_ref(v) for k, v in obj.items()}
             elif isinstance(obj, list):
-                return [resolve_ref(item, defs) for item in obj]
+                return [resolve_ref(item) for item in obj]
             else:
                 return obj
 
-        return resolve_ref(schema, defs)
-
+        # Resolution builds a fresh tree, so the input schema is never mutated
+        # and no upfront deep copy is needed
+        top = {k: v for k, v in schema.items() if k != "$defs"}
+        return resolve_ref(top)
@@ -7,19 +7,124 @@ ephemeral testing and development environments.
 
 import asyncio
 import logging
+import re
+import shutil
+import socket
+import tempfile
+import threading
 import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Set, Tuple
 
 import docker
 from docker.models.containers import Container
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CANTON_IMAGE = "digitalasset/canton-open-source:latest"
 
-@dataclass
+# Log lines that mean Canton can never become ready: the ledger/JSON API
+# ports are taken. Bytes pattern so log lines are scanned without decoding.
+_FATAL_LOG_RE = re.compile(rb"java\.net\.BindException|Address already in use")
+
+# Longest unterminated log line kept while waiting for its newline
+_LOG_LINE_MAX = 64 * 1024
+
+
+
+def _is_port_free(port: int) -> bool:
+    """Check whether a host port can be bound (i.e. Docker can publish it)"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(("0.0.0.0", port))
+        except OSError:
+            return False
+    return True
+
+
+class _LogWatcher:
+    """
+    Follows a container's logs in a background thread and reports the first
+    fatal start-up error, until stopped.
+    """
+    
+    def __init__(self, container: Container, on_fatal):
+        """
+        Args:
+            container: Container to follow
+            on_fatal: Called with the offending log line on the first match
+        """
+        self.container = container
+        self.on_fatal = on_fatal
+        self._stopped = threading.Event()
+        self._stream = None
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name=f"{container.name}-logs", daemon=True
+        )
+    
+    def start(self) -> None:
+        """Start following the logs"""
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop following the logs, closing the Docker log stream"""
+        self._stopped.set()
+        self._close_stream()
+    
+    def _run(self) -> None:
+        """Thread body: scan log chunks until a fatal match, the end of the stream or stop()"""
+        try:
+            stream = self.container.logs(stream=True, follow=True, stdout=True, stderr=True)
+            with self._lock:
+                # stop() may have run while the stream was being opened
+                self._stream = stream
+                if self._stopped.is_set():
+                    return
+            
+            # Docker chunks don't follow line boundaries: match complete
+            # lines, carrying a partial last line over to the next chunk
+            pending = b""
+            for chunk in stream:
+                if self._stopped.is_set():
+                    return
+                *lines, pending = (pending + chunk).split(b"\n")
+                if len(pending) > _LOG_LINE_MAX:
+                    pending = pending[-_LOG_LINE_MAX:]
+                if self._report_fatal(lines):
+                    return
+            self._report_fatal([pending])
+        except Exception as e:
+            logger.debug(f"Log stream ended for {self.container.name}: {e}")
+        finally:
+            self._close_stream()
+    
+    def _report_fatal(self, lines) -> bool:
+        """Call on_fatal with the first fatal line, if any; True if one was found"""
+        for line in lines:
+            if _FATAL_LOG_RE.search(line) and not self._stopped.is_set():
+                # Only the matching line is ever decoded
+                self.on_fatal(line.decode('utf-8', errors='replace').strip())
+                return True
+        return False
+    
+    def _close_stream(self) -> None:
+        """Close the log stream once, from whichever thread gets here first"""
+        with self._lock:
+            stream, self._stream = self._stream, None
+        close = getattr(stream, "close", None)
+        if close is not None:
+            try:
+                # Shuts down the HTTP connection, unblocking a pending read
+                close()
+            except Exception as e:
+                logger.debug(f"Failed to close log stream for {self.container.name}: {e}")
+
+
+@dataclass(slots=True)
 class CantonEnvironment:
     """Represents a running Canton sandbox environment"""
     
@@ -27,52 +132,131 @@ class CantonEnvironment:
     container: Optional[Container] = None
     ledger_port: int = 6865
     json_port: int = 7575
-    started_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))  # For display
+    started_at_monotonic: float = field(default_factory=time.monotonic)  # For uptime math
     config_dir: Optional[Path] = None  # Temp config directory to cleanup
+    _last_reload_ts: float = field(default=0.0, repr=False)
+    _cached_status: Optional[str] = field(default=None, repr=False)
+    
+    def _refresh_status(self, ttl: float = 1.0) -> Optional[str]:
+        """
+        Return the container status, reloading it from Docker at most once per ttl.
+        
+        Each container.reload() is a round-trip to the Docker daemon; polling
+        loops call this several times per iteration, so the last status is
+        reused while it is fresh.
+        
+        Args:
+            ttl: Seconds a previously reloaded status stays valid
+            
+        Returns:
+            Container status string, or None if there is no container
+        """
+        if not self.container:
+            return None
+        
+        now = time.monotonic()
+        if self._cached_status is None or now - self._last_reload_ts >= ttl:
+            self.container.reload()
+            self._cached_status = self.container.status
+            self._last_reload_ts = now
+        return self._cached_status
+    
+    def uptime_seconds(self) -> float:
+        """Seconds since the environment was started (monotonic clock)"""
+        return time.monotonic() - self.started_at_monotonic
+    
+    def _past_grace_period(self) -> bool:
+        """Canton takes time to start; only probe after 5 seconds of uptime"""
+        return self.uptime_seconds() >= 5
+    
+    def _check_container_running(self) -> bool:
+        """Check that the container exists and is running"""
+        return self.container is not None and self._refresh_status() == "running"
+    
+    def _check_ledger_port(self) -> bool:
+        """
+        Check if the ledger API port is accepting connections.
+        
+        Does not look at the container; callers check that first.
+        """
+        if not self._past_grace_period():
+            return False
+        
+        try:
+            # Context manager closes the probe socket even if connect fails
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.settimeout(1)
+                result = sock.connect_ex(('localhost', self.ledger_port))
+            # Port is open if result is 0
+            if result == 0:
+                logger.debug("Ledger API port %d is accepting connections", self.ledger_port)
+                return True
+        except Exception as e:
+            logger.debug("Socket check failed: %s", e)
+        
+        return False
     
     def is_healthy(self) -> bool:
         """Check if Canton is responding"""
-        # Check container status
-        if not self.container:
+        try:
+            return self._check_container_running() and self._check_ledger_port()
+        except Exception as e:
+            logger.debug("Health check failed: %s", e)
             return False
+    
+    async def is_healthy_async(self) -> bool:
+        """
+        Check if Canton is responding, without blocking the event loop.
         
+        Same checks as is_healthy(), but the ledger API port probe uses a
+        non-blocking asyncio connection instead of a socket in a worker thread.
+        """
         try:
-            self.container.reload()
-            if self.container.status != "running":
+            if self.container is None or not self._past_grace_period():
                 return False
             
-            # Canton takes time to start, check if it's been running for a bit
-            # and check if gRPC ports are listening
-            uptime = (datetime.utcnow() - self.started_at).total_seconds()
+            # A stale status means a Docker API call; keep it off the event loop
+            if await asyncio.to_thread(self._refresh_status) != "running":
+                return False
             
-            # If container has been running for at least 5 seconds, 
-            # check if we can connect to the ledger API port
-            if uptime >= 5:
-                import socket
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(1)
-                    result = sock.connect_ex(('localhost', self.ledger_port))
-                    sock.close()
-                    # Port is open if result is 0
-                    if result == 0:
-                        logger.debug(f"Ledger API port {self.ledger_port} is accepting connections")
-                        return True
-                except Exception as e:
-                    logger.debug(f"Socket check failed: {e}")
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection('localhost', self.ledger_port), timeout=1
+                )
+            except (OSError, asyncio.TimeoutError) as e:
+                logger.debug("Socket check failed: %s", e)
+                return False
             
-            return False
+            writer.close()
+            try:
+                # Let the transport finish closing instead of leaving it to the loop
+                await asyncio.wait_for(writer.wait_closed(), timeout=1)
+            except Exception:
+                pass
+            logger.debug("Ledger API port %d is accepting connections", self.ledger_port)
+            return True
             
         except Exception as e:
-            logger.debug(f"Health check failed: {e}")
+            logger.debug("Health check failed: %s", e)
             return False
     
-    def stop(self):
-        """Stop Canton environment"""
+    def stop(self, graceful: bool = True):
+        """
+        Stop Canton environment.
+        
+        Args:
+            graceful: If True, send SIGTERM and allow up to 10s to shut down;
+                otherwise kill the container immediately (sandboxes use
+                in-memory storage, so nothing is lost)
+        """
         if self.container:
             try:
                 logger.info(f"Stopping container: {self.env_id}")
-                self.container.stop(timeout=10)
+                if graceful:
+                    self.container.stop(timeout=10)
+                else:
+                    self.container.kill()
             except Exception as e:
                 logger.error(f"Failed to stop container {self.env_id}: {e}")
     
@@ -88,7 +272,6 @@ class CantonEnvironment:
         # Cleanup temp config directory
         if self.config_dir and self.config_dir.exists():
             try:
-                import shutil
                 shutil.rmtree(self.config_dir)
                 logger.debug(f"Cleaned up config dir: {self.config_dir}")
             except Exception as e:
@@ -107,8 +290,14 @@ class CantonManager:
     
     def __init__(self):
         """Initialize Canton manager with Docker client"""
+        from ..env import get_env_int
+        
         try:
-            self.docker_client = docker.from_env()
+            # Every environment's container shares this client's connection
+            # pool; size it for concurrent spin-ups/health checks/teardowns
+            self.docker_client = docker.from_env(
+                max_pool_size=get_env_int("CANTON_DOCKER_MAX_POOL_SIZE", 32)
+            )
             # Test Docker connection
             self.docker_client.ping()
             logger.info("✅ Docker client initialized")
@@ -119,30 +308,61 @@ class CantonManager:
             ) from e
         
         self.environments: Dict[str, CantonEnvironment] = {}
+        # Images already confirmed present locally (skips images.get per spin-up)
+        self._image_cache: Set[str] = set()
+        # Rendered sandbox config directories keyed by (ledger_port, json_port)
+        self._config_dir_cache: Dict[Tuple[int, int], Path] = {}
     
-    async def spin_up_docker(
-        self,
-        dar_path: Optional[str] = None,
-        ledger_port: int = 6865,
-        json_port: int = 7575,
-        canton_image: str = "digitalasset/canton-open-source:latest"
-    ) -> CantonEnvironment:
+    def _ensure_image(self, canton_image: str) -> None:
+        """Make sure an image is available locally, pulling it if needed"""
+        if canton_image in self._image_cache:
+            return
+        
+        try:
+            self.docker_client.images.get(canton_image)
+        except docker.errors.ImageNotFound:
+            logger.info(f"📥 Pulling Canton image: {canton_image}")
+            self.docker_client.images.pull(canton_image)
+        
+        self._image_cache.add(canton_image)
+    
+    async def prewarm(self, canton_image: str = DEFAULT_CANTON_IMAGE) -> None:
         """
-        Start Canton sandbox in Docker container.
+        Pull the Canton image ahead of the first spin-up.
+        
+        Runs the (potentially slow) pull in a worker thread so callers can
+        start it in the background at startup. Failures are logged and the
+        pull is retried on the next spin-up.
+        
+        Args:
+            canton_image: Docker image to pull
+        """
+        try:
+            await asyncio.to_thread(self._ensure_image, canton_image)
+            logger.info(f"✅ Canton image ready: {canton_image}")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to prewarm Canton image {canton_image}: {e}")
+    
+    def _get_config_dir(self, ledger_port: int, json_port: int) -> Path:
+        """
+        Return a directory holding the sandbox config for the given ports.
+        
+        The config depends only on the ports, so it is written once per
+        (ledger_port, json_port) pair and shared by every environment using
+        them. Cached directories are owned by the manager and removed in
+        teardown_all(), not when an individual environment is removed.
         
         Args:
-            dar_path: Optional path to DAR file to load
             ledger_port: Port for Ledger API (gRPC)
             json_port: Port for JSON API (HTTP)
-            canton_image: Docker image to use
             
         Returns:
-            CantonEnvironment instance
-            
-        Raises:
-            RuntimeError: If Canton fails to start or become healthy
+            Path to a directory containing sandbox.conf
         """
-        env_id = f"canton-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}"
+        key = (ledger_port, json_port)
+        config_dir = self._config_dir_cache.get(key)
+        if config_dir is not None and (config_dir / "sandbox.conf").exists():
+            return config_dir
         
         # Create minimal Canton config for sandbox mode
         canton_config = f"""
@@ -157,14 +377,51 @@ canton {{
 }}
 """
         
+        config_dir = Path(tempfile.mkdtemp(prefix="canton-config-"))
+        (config_dir / "sandbox.conf").write_text(canton_config)
+        self._config_dir_cache[key] = config_dir
+        return config_dir
+    
+    async def spin_up_docker(
+        self,
+        dar_path: Optional[str] = None,
+        ledger_port: int = 6865,
+        json_port: int = 7575,
+        canton_image: str = DEFAULT_CANTON_IMAGE
+    ) -> CantonEnvironment:
+        """
+        Start Canton sandbox in Docker container.
+        
+        Args:
+            dar_path: Optional path to DAR file to load
+            ledger_port: Port for Ledger API (gRPC)
+            json_port: Port for JSON API (HTTP)
+            canton_image: Docker image to use
+            
+        Returns:
+            CantonEnvironment instance
+            
+        Raises:
+            RuntimeError: If a port is already in use, or Canton fails to
+                start or become healthy
+        """
+        # Fail fast on port conflicts instead of waiting out the health check
+        busy_ports = [
+            port for port in (ledger_port, json_port, ledger_port + 1000)
+            if not _is_port_free(port)
+        ]
+        if busy_ports:
+            raise RuntimeError(
+                f"Cannot start Canton: port(s) already in use: {', '.join(map(str, busy_ports))}"
+            )
+        
+        env_id = f"canton-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}"
+        
         # Build command - use daemon mode with config
         cmd = ["daemon", "-c", "/canton-config/sandbox.conf"]
         
-        # Setup volumes
-        import tempfile
-        config_dir = Path(tempfile.mkdtemp(prefix="canton-config-"))
-        config_file = config_dir / "sandbox.conf"
-        config_file.write_text(canton_config)
+        # Setup volumes (config dirs are rendered once per port pair and reused)
+        config_dir = self._get_config_dir(ledger_port, json_port)
         
         volumes = {
             str(config_dir): {
@@ -189,18 +446,16 @@ canton {{
         logger.debug(f"Ports: Ledger={ledger_port}, JSON={json_port}")
         
         try:
-            # Pull image if not present
-            try:
-                self.docker_client.images.get(canton_image)
-            except docker.errors.ImageNotFound:
-                logger.info(f"📥 Pulling Canton image: {canton_image}")
-                self.docker_client.images.pull(canton_image)
+            # Pull image if not present (Docker SDK calls block, so run them
+            # in worker threads to keep the event loop free)
+            await asyncio.to_thread(self._ensure_image, canton_image)
             
             # Calculate admin API port
             admin_port = ledger_port + 1000
             
             # Start container
-            container = self.docker_client.containers.run(
+            container = await asyncio.to_thread(
+                self.docker_client.containers.run,
                 canton_image,
                 command=cmd,
                 ports={
@@ -219,8 +474,7 @@ canton {{
                 env_id=env_id,
                 container=container,
                 ledger_port=ledger_port,
-                json_port=json_port,
-                config_dir=config_dir
+                json_port=json_port
             )
             
             # Wait for Canton to be ready
@@ -229,38 +483,21 @@ canton {{
             logger.debug(f"Container name: {container.name}")
             logger.debug(f"Container status: {container.status}")
             
-            if not await self.wait_for_ready(env, timeout=60):
+            # Watch the logs so unrecoverable errors fail fast; the watcher
+            # only lives as long as the wait
+            fatal_event, log_watcher = self._start_log_watcher(container)
+            try:
+                ready = await self.wait_for_ready(env, timeout=60, fatal_event=fatal_event)
+            finally:
+                log_watcher.stop()
+            
+            if not ready:
                 # Capture detailed logs before cleanup
                 logger.error("❌ Canton failed to start. Gathering diagnostics...")
+                await asyncio.to_thread(self._log_failure_diagnostics, container)
                 
-                # Container status
-                try:
-                    container.reload()
-                    logger.error(f"Container status: {container.status}")
-                    logger.error(f"Container health: {container.attrs.get('State', {})}")
-                except Exception as e:
-                    logger.error(f"Failed to get container status: {e}")
-                
-                # Container logs (all of them)
-                try:
-                    logs = container.logs(tail=100).decode('utf-8', errors='replace')
-                    if logs:
-                        logger.error(f"Canton logs:\n{logs}")
-                    else:
-                        logger.error("No logs available from container")
-                except Exception as e:
-                    logger.error(f"Failed to get logs: {e}")
-                
-                # Check if ports are actually exposed
-                try:
-                    container.reload()
-                    ports = container.ports
-                    logger.error(f"Container ports: {ports}")
-                except Exception as e:
-                    logger.error(f"Failed to get ports: {e}")
-                
-                container.stop()
-                container.remove()
+                await asyncio.to_thread(container.stop)
+                await asyncio.to_thread(container.remove)
                 raise RuntimeError(
                     "Canton failed to start within timeout. Check logs above."
                 )
@@ -276,52 +513,126 @@ canton {{
             logger.error(f"❌ Failed to start Canton: {e}")
             raise
     
+    @staticmethod
+    def _log_failure_diagnostics(container: Container) -> None:
+        """Log status, recent logs and port bindings of a container that failed to start"""
+        # Container status (reload also refreshes the port bindings below)
+        try:
+            container.reload()
+            logger.error(f"Container status: {container.status}")
+            logger.error(f"Container health: {container.attrs.get('State', {})}")
+        except Exception as e:
+            logger.error(f"Failed to get container status: {e}")
+        
+        # Container logs (all of them)
+        try:
+            logs = container.logs(tail=100)
+            if logs:
+                logger.error(f"Canton logs:\n{logs.decode('utf-8', errors='replace')}")
+            else:
+                logger.error("No logs available from container")
+        except Exception as e:
+            logger.error(f"Failed to get logs: {e}")
+        
+        # Check if ports are actually exposed
+        try:
+            logger.error(f"Container ports: {container.ports}")
+        except Exception as e:
+            logger.error(f"Failed to get ports: {e}")
+    
+    def _start_log_watcher(self, container: Container) -> Tuple[asyncio.Event, _LogWatcher]:
+        """
+        Start streaming container logs in the background.
+        
+        Returns:
+            Event that is set as soon as a fatal error shows up in the logs,
+            and the watcher, which must be stopped once the wait is over
+        """
+        loop = asyncio.get_running_loop()
+        fatal_event = asyncio.Event()
+        
+        def on_fatal(line: str) -> None:
+            logger.error(f"❌ Fatal Canton start-up error: {line}")
+            try:
+                loop.call_soon_threadsafe(fatal_event.set)
+            except RuntimeError:
+                # Loop already closed - nobody is waiting any more
+                pass
+        
+        watcher = _LogWatcher(container, on_fatal)
+        watcher.start()
+        return fatal_event, watcher
+    
     async def wait_for_ready(
         self,
         env: CantonEnvironment,
         timeout: int = 60,
-        poll_interval: int = 2
+        poll_interval: int = 2,
+        start_period: float = 10.0,
+        start_interval: float = 0.25,
+        fatal_event: Optional[asyncio.Event] = None
     ) -> bool:
         """
         Wait for Canton to be ready by polling health endpoint.
         
+        Probes immediately, then every start_interval seconds during the
+        first start_period seconds so a sandbox that comes up quickly is
+        noticed right away, and every poll_interval seconds after that.
+        
         Args:
             env: Canton environment to check
             timeout: Maximum time to wait in seconds
             poll_interval: Time between health checks in seconds
+            start_period: Initial window (seconds) using the faster interval
+            start_interval: Time between health checks during start_period
+            fatal_event: Optional event signalling an unrecoverable start-up
+                error; the wait is aborted as soon as it is set
             
         Returns:
             True if Canton becomes ready, False if timeout
         """
         start_time = time.time()
         attempts = 0
+        next_progress_log = 10
         
         while (time.time() - start_time) < timeout:
             attempts += 1
             elapsed = int(time.time() - start_time)
             
-            # Log every 5 attempts to show progress
-            if attempts % 5 == 0:
+            # Log roughly every 10s to show progress (attempt rate varies)
+            if elapsed >= next_progress_log:
                 logger.info(f"Still waiting... (attempt {attempts}, {elapsed}s elapsed)")
+                next_progress_log = elapsed + 10
             
             # Check container status first
             if env.container:
                 try:
-                    env.container.reload()
-                    status = env.container.status
+                    status = await asyncio.to_thread(env._refresh_status)
                     if status == "exited":
                         logger.error(f"Container exited prematurely (exit code: {env.container.attrs['State'].get('ExitCode')})")
                         return False
-                    logger.debug(f"Attempt {attempts}: Container status={status}")
+                    logger.debug("Attempt %d: Container status=%s", attempts, status)
                 except Exception as e:
-                    logger.debug(f"Attempt {attempts}: Failed to check container: {e}")
+                    logger.debug("Attempt %d: Failed to check container: %s", attempts, e)
             
-            if env.is_healthy():
+            if await env.is_healthy_async():
                 logger.info(f"✅ Canton ready after {attempts} attempts ({elapsed}s)")
                 return True
             
-            logger.debug(f"Attempt {attempts}: Canton not ready yet")
-            await asyncio.sleep(poll_interval)
+            logger.debug("Attempt %d: Canton not ready yet", attempts)
+            in_start_period = (time.time() - start_time) < start_period
+            delay = start_interval if in_start_period else poll_interval
+            if fatal_event is None:
+                await asyncio.sleep(delay)
+                continue
+            
+            # Sleep until the next probe, waking early on a fatal log line
+            try:
+                await asyncio.wait_for(fatal_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                continue
+            logger.error("❌ Canton reported a fatal error during start-up")
+            return False
         
         logger.error(f"❌ Canton failed to start within {timeout}s after {attempts} attempts")
         return False
@@ -340,13 +651,14 @@ canton {{
         if not env:
             return {"exists": False}
         
+        # Read the container status once; the port is only probed if running
         container_status = "unknown"
         if env.container:
             try:
-                env.container.reload()
-                container_status = env.container.status
+                container_status = env._refresh_status()
             except Exception as e:
                 logger.error(f"Failed to get container status: {e}")
+        healthy = container_status == "running" and env._check_ledger_port()
         
         return {
             "exists": True,
@@ -355,48 +667,61 @@ canton {{
             "ledger_port": env.ledger_port,
             "json_port": env.json_port,
             "started_at": env.started_at.isoformat(),
-            "uptime_seconds": int((datetime.utcnow() - env.started_at).total_seconds()),
-            "healthy": env.is_healthy()
+            "uptime_seconds": int(env.uptime_seconds()),
+            "healthy": healthy
         }
     
-    async def teardown(self, env_id: str):
+    async def teardown(self, env_id: str, graceful: bool = True):
         """
         Stop and remove a Canton environment.
         
         Args:
             env_id: Environment ID to teardown
+            graceful: Stop the container gracefully instead of killing it
         """
-        env = self.environments.get(env_id)
+        # Untrack first so concurrent teardowns of the same ID don't race
+        env = self.environments.pop(env_id, None)
         if not env:
             logger.warning(f"Environment not found: {env_id}")
             return
         
         logger.info(f"🧹 Tearing down environment: {env_id}")
         
-        # Stop container
-        env.stop()
+        # Stop and remove container (blocking Docker calls, off the event loop)
+        await asyncio.to_thread(env.stop, graceful)
+        await asyncio.to_thread(env.remove)
         
-        # Remove container
-        env.remove()
-        
-        # Remove from tracking
-        del self.environments[env_id]
         logger.info(f"✅ Environment removed: {env_id}")
     
-    async def teardown_all(self):
-        """Stop and remove all Canton environments"""
+    async def teardown_all(self, graceful: bool = False):
+        """
+        Stop and remove all Canton environments concurrently.
+        
+        Args:
+            graceful: Stop containers gracefully instead of killing them.
+                Defaults to False since sandboxes hold no durable state.
+        """
         env_ids = list(self.environments.keys())
         logger.info(f"🧹 Tearing down {len(env_ids)} environment(s)")
         
-        for env_id in env_ids:
-            await self.teardown(env_id)
+        await asyncio.gather(*(self.teardown(env_id, graceful) for env_id in env_ids))
+        
+        # Shared config directories outlive individual environments
+        for config_dir in self._config_dir_cache.values():
+            shutil.rmtree(config_dir, ignore_errors=True)
+        self._config_dir_cache.clear()
     
-    def list_environments(self) -> List[Dict[str, Any]]:
+    async def list_environments(self) -> List[Dict[str, Any]]:
         """
         List all running Canton environments.
         
+        Status checks block on Docker and the ledger port probe, so they run
+        concurrently in worker threads rather than one after another.
+        
         Returns:
             List of environment status dictionaries
         """
-        return [self.get_status(env_id) for env_id in self.environments.keys()]
+        return list(await asyncio.gather(
+            *(asyncio.to_thread(self.get_status, env_id) for env_id in list(self.environments))
+        ))
 
@@ -22,6 +22,18 @@ from .types.mcp import AudioContent, ContentBlock, ImageContent, TextContent
 
 logger = logging.getLogger(__name__)
 
+# MCP log levels mapped to stdlib levels (unknown levels log as INFO)
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "notice": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "alert": logging.CRITICAL,
+    "emergency": logging.CRITICAL,
+}
+
 
 class ToolContext(Generic[TParams, TResult]):
     """
@@ -87,6 +99,7 @@ class ToolContext(Generic[TParams, TResult]):
         # Request metadata
         self._request_id = request.request_id
         self._progress_token = request.progress_token
+        self._warned_no_progress_token = False
 
     # =============================================================================
     # Output Methods - How tools send responses
@@ -113,9 +126,12 @@ class ToolContext(Generic[TParams, TResult]):
             ```
         """
         if not self._progress_token:
-            logger.warning(
-                "Progress notification requested but no progress token available"
-            )
+            # Tools often report progress in tight loops; warn only once
+            if not self._warned_no_progress_token:
+                self._warned_no_progress_token = True
+                logger.warning(
+                    "Progress notification requested but no progress token available"
+                )
             return None
 
         return NotificationResponse.progress(
@@ -144,13 +160,15 @@ class ToolContext(Generic[TParams, TResult]):
             yield ctx.log("info", "Processing started", {"items": 42})
             ```
         """
-        # Log locally too
-        log_method = getattr(logger, level.lower(), logger.info)
-        log_method(f"[{self.request.name}] {message}")
+        # Log locally too (skip formatting when the level is filtered out)
+        level = level.lower()
+        level_no = _LOG_LEVELS.get(level, logging.INFO)
+        if logger.isEnabledFor(level_no):
+            logger.log(level_no, f"[{self.request.name}] {message}")
 
         # Create notification for client
         return NotificationResponse.message(
-            level=level.lower(),
+            level=level,
             logger=self.request.name,
             data=data or {},
             message=message,
@@ -208,25 +226,25 @@ class ToolContext(Generic[TParams, TResult]):
         if content and data:
             # Both: unstructured + structured
             return ToolResponse.success(
-                id=self.request.request_id,
+                id=self._request_id,
                 content=content,
                 structured_content=data,
             )
         elif data:
             # Structured only (with JSON text for compatibility)
             return ToolResponse.structured_result(
-                id=self.request.request_id,
+                id=self._request_id,
                 structured_data=data,
             )
         elif content:
             # Unstructured only
             return ToolResponse.unstructured_result(
-                id=self.request.request_id,
+                id=self._request_id,
                 content=content,
             )
         else:
             # Nothing provided - empty success
-            return ToolResponse.text_result(id=self.request.request_id, text="Success")
+            return ToolResponse.text_result(id=self._request_id, text="Success")
 
     # =============================================================================
     # Structured Response
@@ -257,10 +275,12 @@ class ToolContext(Generic[TParams, TResult]):
         """
         # Convert Pydantic model to dict if needed
         # Use by_alias=True to get camelCase field names for MCP protocol
+        # The text content is left to structured_result's json.dumps, so
+        # clients keep getting the same (\uXXXX-escaped) JSON text
         data = result.model_dump(by_alias=True) if hasattr(result, "model_dump") else result
 
         return ToolResponse.structured_result(
-            id=self.request.request_id,
+            id=self._request_id,
             structured_data=data,
             summary_text=summary_text,
         )
@@ -290,7 +310,7 @@ class ToolContext(Generic[TParams, TResult]):
             ```
         """
         return ToolResponse.unstructured_result(
-            id=self.request.request_id,
+            id=self._request_id,
             content=content,
         )
 
@@ -313,7 +333,7 @@ class ToolContext(Generic[TParams, TResult]):
             yield ctx.text("Processing complete!")
             ```
         """
-        return ToolResponse.text_result(id=self.request.request_id, text=message)
+        return ToolResponse.text_result(id=self._request_id, text=message)
 
     def image(self, data: str, mime_type: str, alt_text: str = None):
         """
@@ -342,7 +362,7 @@ class ToolContext(Generic[TParams, TResult]):
             content.insert(0, TextContent(text=alt_text))
 
         return ToolResponse.unstructured_result(
-            id=self.request.request_id,
+            id=self._request_id,
             content=content,
         )
 
@@ -366,7 +386,7 @@ class ToolContext(Generic[TParams, TResult]):
             ```
         """
         return ToolResponse.unstructured_result(
-            id=self.request.request_id,
+            id=self._request_id,
             content=[AudioContent(data=data, mime_type=mime_type)],
         )
 
@@ -390,7 +410,7 @@ class ToolContext(Generic[TParams, TResult]):
             ```
         """
         return ToolResponse.error(
-            id=self.request.request_id,
+            id=self._request_id,
             error_code=code,
             error_message=message,
         )
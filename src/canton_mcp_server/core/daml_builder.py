@@ -5,16 +5,63 @@ Handles building DAML projects, parsing daml.yaml configuration,
 and managing DAR file generation.
 """
 
+import asyncio
 import logging
-import subprocess
-from dataclasses import dataclass
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import yaml
 
+try:
+    # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as _YAML_LOADER
+
 logger = logging.getLogger(__name__)
 
+# Parsed daml.yaml files keyed by path, validated by (mtime_ns, size)
+_YAML_CACHE_MAX = 100
+_YAML_CACHE: "OrderedDict[Path, Tuple[int, int, DAMLProject]]" = OrderedDict()
+
+
+def _newest_source_mtime(project_path: Path, dependency_paths: Tuple[Path, ...] = ()) -> int:
+    """
+    Newest mtime (ns) of everything a build reads: daml.yaml, the .daml
+    sources, the directories holding them and local dependency DARs.
+    
+    Directory mtimes catch sources that were deleted or renamed (a rename
+    keeps the file's own mtime).
+    
+    Raises:
+        FileNotFoundError: If daml.yaml or a dependency DAR is missing
+    """
+    build_dir = os.path.join(project_path, ".daml")
+    newest = max(
+        (project_path / "daml.yaml").stat().st_mtime_ns,
+        project_path.stat().st_mtime_ns,
+        *(path.stat().st_mtime_ns for path in dependency_paths),
+    )
+    
+    # os.scandir walk: directory entries carry their type, so only the
+    # .daml source files and the directories themselves need a stat
+    stack = [str(project_path)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.path != build_dir:
+                        stack.append(entry.path)
+                        newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                elif entry.name.endswith(".daml"):
+                    mtime = entry.stat().st_mtime_ns
+                    if mtime > newest:
+                        newest = mtime
+    return newest
+
 
 @dataclass
 class DAMLProject:
@@ -25,6 +72,8 @@ class DAMLProject:
     sdk_version: str
     source_path: Path
     dar_path: Optional[Path] = None
+    # Local DARs from dependencies/data-dependencies in daml.yaml
+    dependency_paths: Tuple[Path, ...] = ()
     
     def __str__(self) -> str:
         return f"{self.name}-{self.version} (SDK {self.sdk_version})"
@@ -53,19 +102,32 @@ class DAMLBuilder:
             FileNotFoundError: If daml.yaml doesn't exist
             ValueError: If required fields are missing
         """
-        project_path = Path(project_path).resolve()
+        return DAMLBuilder._parse_resolved(Path(project_path).resolve())
+    
+    @staticmethod
+    def _parse_resolved(project_path: Path) -> DAMLProject:
+        """parse_daml_yaml for a path that has already been resolved"""
         daml_yaml = project_path / "daml.yaml"
         
-        if not daml_yaml.exists():
+        try:
+            st = daml_yaml.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"daml.yaml not found in {project_path}. "
                 "Is this a valid DAML project?"
-            )
+            ) from None
+        
+        # Reuse the previous parse if the file is unchanged
+        cached = _YAML_CACHE.get(daml_yaml)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _YAML_CACHE.move_to_end(daml_yaml)
+            # Hand out a copy; build() sets dar_path on the returned project
+            return replace(cached[2])
         
         logger.debug(f"Parsing daml.yaml: {daml_yaml}")
         
-        with open(daml_yaml, 'r') as f:
-            config = yaml.safe_load(f)
+        with open(daml_yaml, 'rb') as f:
+            config = yaml.load(f, Loader=_YAML_LOADER)
         
         if not config:
             raise ValueError(f"daml.yaml is empty or invalid: {daml_yaml}")
@@ -82,13 +144,25 @@ class DAMLBuilder:
         if not sdk_version:
             raise ValueError("daml.yaml missing required field: sdk-version")
         
+        # Entries such as daml-prim name SDK packages; only .dar paths are files
+        dependencies = (config.get('dependencies') or []) + (config.get('data-dependencies') or [])
+        
         project = DAMLProject(
             name=name,
             version=version,
             sdk_version=sdk_version,
-            source_path=project_path
+            source_path=project_path,
+            dependency_paths=tuple(
+                project_path / dep
+                for dep in dependencies
+                if isinstance(dep, str) and dep.endswith(".dar")
+            )
         )
         
+        _YAML_CACHE[daml_yaml] = (st.st_mtime_ns, st.st_size, replace(project))
+        if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+        
         logger.info(f"📋 Parsed project: {project}")
         return project
     
@@ -108,53 +182,81 @@ class DAMLBuilder:
         """
         project_path = Path(project_path).resolve()
         
-        # Parse project configuration
-        project = self.parse_daml_yaml(project_path)
+        # Parse project configuration (path is already resolved)
+        project = self._parse_resolved(project_path)
+        
+        dar_path = (
+            project_path / ".daml" / "dist" /
+            f"{project.name}-{project.version}.dar"
+        )
+        
+        # Skip the compiler when the DAR is newer than every build input
+        try:
+            dar_stat = dar_path.stat()
+            up_to_date = dar_stat.st_mtime_ns >= _newest_source_mtime(
+                project_path, project.dependency_paths
+            )
+        except FileNotFoundError:
+            # No DAR yet, or a missing dependency the compiler should report
+            up_to_date = False
+        if up_to_date:
+            project.dar_path = dar_path
+            logger.info(f"✅ DAR up to date: {dar_path.name} ({dar_stat.st_size / 1024:.1f} KB)")
+            return project
         
         logger.info(f"🔨 Building DAML project: {project}")
         
-        # Run daml build
+        # Run daml build without blocking the event loop
         try:
-            result = subprocess.run(
-                ["daml", "build"],
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=120  # 2 minute timeout
+            proc = await asyncio.create_subprocess_exec(
+                "daml", "build",
+                cwd=str(project_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            
-            if result.returncode != 0:
-                logger.error(f"DAML build failed (exit code {result.returncode})")
-                logger.error(f"stdout: {result.stdout}")
-                logger.error(f"stderr: {result.stderr}")
-                raise RuntimeError(
-                    f"DAML build failed: {result.stderr or result.stdout}"
-                )
-            
-            logger.debug(f"Build output: {result.stdout}")
-            
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("DAML build timed out after 120 seconds")
         except FileNotFoundError:
             raise RuntimeError(
                 "daml command not found. Is DAML SDK installed? "
                 "Install from: https://docs.daml.com/getting-started/installation.html"
             )
         
-        # Find generated DAR file
-        dar_path = (
-            project_path / ".daml" / "dist" /
-            f"{project.name}-{project.version}.dar"
-        )
+        try:
+            stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                proc.communicate(),
+                timeout=120  # 2 minute timeout
+            )
+        except asyncio.TimeoutError:
+            raise RuntimeError("DAML build timed out after 120 seconds")
+        finally:
+            # Never leave the compiler running (timeout, cancellation, errors)
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+        
+        stdout = stdout_bytes.decode("utf-8", "replace")
+        stderr = stderr_bytes.decode("utf-8", "replace")
+        
+        if proc.returncode != 0:
+            logger.error(f"DAML build failed (exit code {proc.returncode})")
+            logger.error(f"stdout: {stdout}")
+            logger.error(f"stderr: {stderr}")
+            raise RuntimeError(
+                f"DAML build failed: {stderr or stdout}"
+            )
+        
+        logger.debug(f"Build output: {stdout}")
         
-        if not dar_path.exists():
+        # Find generated DAR file
+        try:
+            dar_stat = dar_path.stat()
+        except FileNotFoundError:
             raise RuntimeError(
                 f"DAR file not found after build: {dar_path}. "
                 "Build may have succeeded but DAR location is unexpected."
-            )
+            ) from None
         
         project.dar_path = dar_path
-        logger.info(f"✅ Built DAR: {dar_path.name} ({dar_path.stat().st_size / 1024:.1f} KB)")
+        logger.info(f"✅ Built DAR: {dar_path.name} ({dar_stat.st_size / 1024:.1f} KB)")
         
         return project
 
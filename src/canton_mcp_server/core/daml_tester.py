@@ -4,16 +4,30 @@ DAML Tester - DAML Test Execution and Result Parsing
 Executes DAML test suites and parses test results for reporting.
 """
 
+import asyncio
+import itertools
 import logging
 import re
-import subprocess
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List
 
 logger = logging.getLogger(__name__)
 
+# Test result indicators in `daml test` output, compiled once and applied
+# per line (only to lines that contain the marker)
+_OK_RE = re.compile(r'(?:^|\s)ok(?:\s|$)')
+_FAILURE_MESSAGE_RES = (
+    ('✗', re.compile(r'✗\s+(.+)')),  # ✗ followed by failure message
+    ('FAIL', re.compile(r'FAIL\s+(.+)')),  # FAIL followed by test name
+    ('failed:', re.compile(r'failed:\s+(.+)')),  # "failed: ..." messages
+)
+
+# Lines of streamed `daml test` output kept on the TestResult for reporting
+_OUTPUT_TAIL_LINES = 500
+
 
 @dataclass
 class TestResult:
@@ -24,9 +38,15 @@ class TestResult:
     tests_passed: int
     tests_failed: int
     duration_seconds: float
-    output: str
+    stdout: str = ""
+    stderr: str = ""
     failures: List[str] = field(default_factory=list)
     
+    @property
+    def output(self) -> str:
+        """Combined stdout and stderr, joined only when asked for"""
+        return self.stdout + self.stderr
+    
     def __str__(self) -> str:
         status = "✅ PASSED" if self.success else "❌ FAILED"
         return (
@@ -35,6 +55,99 @@ class TestResult:
         )
 
 
+class _TestOutputParser:
+    """
+    Incremental `daml test` output parser.
+    
+    Lines are fed one at a time, so output can be classified while it is
+    still being read from the process.
+    """
+    
+    def __init__(self):
+        self.tests_passed = 0
+        self.tests_failed = 0
+        # Insertion-ordered dict doubles as the de-duplicating failure list
+        self.failures: Dict[str, None] = {}
+        self.saw_no_tests = False
+    
+    def feed(self, line: str) -> None:
+        """Classify a single output line"""
+        # Look for test result indicators
+        # DAML test output typically shows:
+        # - "✓" or "ok" for passed tests
+        # - "✗" or "FAIL" for failed tests
+        # - Summary lines like "X tests, Y failures"
+        # Cheap substring checks run before any regex
+        if '✓' in line:
+            self.tests_passed += line.count('✓')
+        if 'ok' in line:
+            self.tests_passed += len(_OK_RE.findall(line))
+        if '✗' in line or 'FAIL' in line:
+            self.tests_failed += line.count('✗') + line.count('FAIL')
+        
+        for marker, pattern in _FAILURE_MESSAGE_RES:
+            if marker in line:
+                match = pattern.search(line)
+                if match:
+                    failure = match.group(1).strip()
+                    if failure:
+                        self.failures[failure] = None
+        
+        if "No tests to run" in line or "0 tests" in line:
+            self.saw_no_tests = True
+    
+    def feed_lines(self, lines: Iterable[str]) -> None:
+        """Classify several output lines"""
+        for line in lines:
+            self.feed(line)
+    
+    def result(
+        self,
+        exit_code: int,
+        duration: float,
+        stdout: str = "",
+        stderr: str = ""
+    ) -> TestResult:
+        """
+        Build the TestResult for everything fed so far.
+        
+        Args:
+            exit_code: Process exit code
+            duration: Test execution duration
+            stdout: Standard output to keep on the result
+            stderr: Standard error to keep on the result
+            
+        Returns:
+            TestResult with parsed information
+        """
+        tests_run = self.tests_passed + self.tests_failed
+        
+        # Determine success
+        # Exit code 0 typically means all tests passed
+        success = (exit_code == 0) and (self.tests_failed == 0)
+        
+        # Handle case where no tests were found
+        if tests_run == 0 and exit_code == 0:
+            # No tests might be ok, or might indicate an issue
+            # Check output for indicators
+            if self.saw_no_tests:
+                logger.info("No tests found in project")
+                success = True
+            else:
+                logger.warning("Unable to parse test results from output")
+        
+        return TestResult(
+            success=success,
+            tests_run=tests_run,
+            tests_passed=self.tests_passed,
+            tests_failed=self.tests_failed,
+            duration_seconds=duration,
+            stdout=stdout,
+            stderr=stderr,
+            failures=list(self.failures)
+        )
+
+
 class DAMLTester:
     """
     Runs DAML tests and parses results.
@@ -64,11 +177,13 @@ class DAMLTester:
         """
         project_path = Path(project_path).resolve()
         
-        if not (project_path / "daml.yaml").exists():
+        try:
+            (project_path / "daml.yaml").stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"daml.yaml not found in {project_path}. "
                 "Is this a valid DAML project?"
-            )
+            ) from None
         
         logger.info(f"🧪 Running DAML tests: {project_path.name}")
         
@@ -79,35 +194,53 @@ class DAMLTester:
         
         start_time = time.time()
         
+        # Run daml test without blocking the event loop; stderr is merged
+        # into stdout so results can be parsed line by line as they arrive
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=180  # 3 minute timeout for tests
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=str(project_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=2 ** 20,  # Allow long single lines (stack traces)
             )
-            
-            duration = time.time() - start_time
-            
-            # Capture output
-            output = result.stdout + result.stderr
-            
-            # Parse test results
-            test_result = self._parse_test_output(output, result.returncode, duration)
-            
-            if test_result.success:
-                logger.info(f"✅ {test_result}")
-            else:
-                logger.warning(f"❌ {test_result}")
-                if test_result.failures:
-                    logger.warning("Failures:")
-                    for failure in test_result.failures:
-                        logger.warning(f"  - {failure}")
-            
-            return test_result
-            
-        except subprocess.TimeoutExpired:
+        except FileNotFoundError:
+            raise RuntimeError(
+                "daml command not found. Is DAML SDK installed? "
+                "Install from: https://docs.daml.com/getting-started/installation.html"
+            )
+        
+        parser = _TestOutputParser()
+        tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+        
+        async def consume() -> None:
+            while True:
+                try:
+                    raw = await proc.stdout.readline()
+                except ValueError:
+                    # Line longer than the stream limit: the reader has already
+                    # dropped what it buffered, so carry on with the rest
+                    logger.debug("Skipped over-long line in daml test output")
+                    continue
+                if not raw:
+                    break
+                line = raw.decode("utf-8", "replace")
+                parser.feed(line)
+                tail.append(line)
+            await proc.wait()
+        
+        timed_out = False
+        try:
+            await asyncio.wait_for(consume(), timeout=180)  # 3 minute timeout for tests
+        except asyncio.TimeoutError:
+            timed_out = True
+        finally:
+            # Never leave daml test running, whatever ended the read
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+        
+        if timed_out:
             duration = time.time() - start_time
             return TestResult(
                 success=False,
@@ -115,18 +248,30 @@ class DAMLTester:
                 tests_passed=0,
                 tests_failed=0,
                 duration_seconds=duration,
-                output="Test execution timed out after 180 seconds",
+                stdout="Test execution timed out after 180 seconds",
                 failures=["Timeout: Tests did not complete within 3 minutes"]
             )
-        except FileNotFoundError:
-            raise RuntimeError(
-                "daml command not found. Is DAML SDK installed? "
-                "Install from: https://docs.daml.com/getting-started/installation.html"
-            )
+        
+        duration = time.time() - start_time
+        
+        # Parse test results (only the output tail is kept for reporting)
+        test_result = parser.result(proc.returncode, duration, stdout="".join(tail))
+        
+        if test_result.success:
+            logger.info(f"✅ {test_result}")
+        else:
+            logger.warning(f"❌ {test_result}")
+            if test_result.failures:
+                logger.warning("Failures:")
+                for failure in test_result.failures:
+                    logger.warning(f"  - {failure}")
+        
+        return test_result
     
     def _parse_test_output(
         self,
-        output: str,
+        stdout: str,
+        stderr: str,
         exit_code: int,
         duration: float
     ) -> TestResult:
@@ -134,66 +279,15 @@ class DAMLTester:
         Parse daml test output to extract test results.
         
         Args:
-            output: Combined stdout and stderr from daml test
+            stdout: Standard output from daml test
+            stderr: Standard error from daml test
             exit_code: Process exit code
             duration: Test execution duration
             
         Returns:
             TestResult with parsed information
         """
-        # Look for test result indicators
-        # DAML test output typically shows:
-        # - "✓" or "ok" for passed tests
-        # - "✗" or "FAIL" for failed tests
-        # - Summary lines like "X tests, Y failures"
-        
-        # Count passed/failed tests
-        passed_matches = re.findall(r'✓|(?:^|\s)ok(?:\s|$)', output, re.MULTILINE)
-        failed_matches = re.findall(r'✗|FAIL', output)
-        
-        tests_passed = len(passed_matches)
-        tests_failed = len(failed_matches)
-        tests_run = tests_passed + tests_failed
-        
-        # Extract failure messages
-        failures = []
-        
-        # Look for common failure patterns
-        failure_patterns = [
-            r'✗\s+(.+?)(?=\n|$)',  # ✗ followed by failure message
-            r'FAIL\s+(.+?)(?=\n|$)',  # FAIL followed by test name
-            r'failed:\s+(.+?)(?=\n|$)',  # "failed: ..." messages
-        ]
-        
-        for pattern in failure_patterns:
-            matches = re.findall(pattern, output, re.MULTILINE)
-            failures.extend(matches)
-        
-        # Remove duplicates and clean up
-        failures = list(dict.fromkeys(failures))  # Preserve order, remove dupes
-        failures = [f.strip() for f in failures if f.strip()]
-        
-        # Determine success
-        # Exit code 0 typically means all tests passed
-        success = (exit_code == 0) and (tests_failed == 0)
-        
-        # Handle case where no tests were found
-        if tests_run == 0 and exit_code == 0:
-            # No tests might be ok, or might indicate an issue
-            # Check output for indicators
-            if "No tests to run" in output or "0 tests" in output:
-                logger.info("No tests found in project")
-                success = True
-            else:
-                logger.warning("Unable to parse test results from output")
-        
-        return TestResult(
-            success=success,
-            tests_run=tests_run,
-            tests_passed=tests_passed,
-            tests_failed=tests_failed,
-            duration_seconds=duration,
-            output=output,
-            failures=failures
-        )
-
+        # stdout then stderr, without building a combined copy
+        parser = _TestOutputParser()
+        parser.feed_lines(itertools.chain(stdout.splitlines(), stderr.splitlines()))
+        return parser.result(exit_code, duration, stdout=stdout, stderr=stderr)
@@ -6,35 +6,246 @@ Uses UDP multicast for broadcasting.
 Fails silently to never break tool execution.
 """
 
-import json
+import atexit
+import functools
 import logging
+import queue
 import socket
+import threading
 import time
 from typing import Any, Dict, Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # DCAP Configuration (loaded from environment)
 TRANSPORT_TYPE = "streamable-http"
 UDP_MAX_SIZE = 1472  # Maximum safe UDP packet size
 
+# Fewest bytes an encoded arg can take besides its key: two quotes, the colon
+# and a one-byte value. Args whose keys alone can't fit in a datagram are not
+# anonymized; everything else is, and _send_udp measures the encoded message
+# to decide whether args have to be dropped.
+_ARG_MIN_ENCODED = 4
+
+# UDP sockets reused across sends, one per destination IP
+_SOCK_CACHE: Dict[str, socket.socket] = {}
+_SOCK_LOCK = threading.Lock()
+
+
+def _get_sock(multicast_ip: str) -> socket.socket:
+    """Get (or lazily create) the cached UDP socket for a destination IP"""
+    sock = _SOCK_CACHE.get(multicast_ip)
+    if sock is not None:
+        return sock
+
+    with _SOCK_LOCK:
+        sock = _SOCK_CACHE.get(multicast_ip)
+        if sock is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+
+            # Set multicast TTL only if using multicast address (239.x.x.x)
+            if multicast_ip.startswith("239."):
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
+
+            _SOCK_CACHE[multicast_ip] = sock
+        return sock
+
+
+def _close_sockets() -> None:
+    """Close all cached UDP sockets (registered to run at exit)"""
+    with _SOCK_LOCK:
+        for sock in _SOCK_CACHE.values():
+            sock.close()
+        _SOCK_CACHE.clear()
+
+
+atexit.register(_close_sockets)
+
+# perf_update messages are encoded and sent by a background worker so the
+# tool call path only pays for a queue put. Messages are dropped (never
+# blocked on) when the queue is full.
+_DCAP_QUEUE: "queue.Queue[tuple]" = queue.Queue(maxsize=1024)
+_WORKER_LOCK = threading.Lock()
+_worker: Optional[threading.Thread] = None
+
+
+_BATCH_WINDOW = 0.005  # Seconds to wait for more messages to coalesce
+_BATCH_MAX_ITEMS = 64
+
+
+def _batching_enabled() -> bool:
+    """perf_batch datagrams need a receiver that understands them (DCAP_BATCH=1)"""
+    config = _get_dcap_config()
+    return bool(config and config.get("batch"))
+
+
+def _dcap_worker() -> None:
+    """Send queued DCAP messages until the process exits"""
+    while True:
+        batch = [_DCAP_QUEUE.get()]
+
+        if _batching_enabled():
+            # Coalesce whatever arrives within a short window
+            deadline = time.monotonic() + _BATCH_WINDOW
+            while len(batch) < _BATCH_MAX_ITEMS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(_DCAP_QUEUE.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+        try:
+            _send_batch(batch)
+        except Exception as e:
+            logger.warning(f"⚠️ DCAP broadcast failed for {len(batch)} message(s): {e}")
+        finally:
+            for _ in batch:
+                _DCAP_QUEUE.task_done()
+
+
+@functools.lru_cache(maxsize=8)
+def _perf_update_prefix(server_id: str) -> bytes:
+    """Pre-encoded constant head of a perf_update message for a server id"""
+    return b'{"v":2,"t":"perf_update","sid":' + orjson.dumps(server_id) + b","
+
+
+def _send_batch(items: list) -> None:
+    """
+    Send queued perf_update items, one datagram per destination.
+
+    Items are (ip, port, server_id, body, tool_name) where body holds the
+    per-call fields; the constant envelope is added at encode time.
+    """
+    by_destination: Dict[tuple, list] = {}
+    for multicast_ip, port, server_id, body, tool_name in items:
+        by_destination.setdefault((multicast_ip, port), []).append((server_id, body, tool_name))
+
+    for (multicast_ip, port), entries in by_destination.items():
+        if len(entries) == 1:
+            server_id, body, tool_name = entries[0]
+            _send_udp(multicast_ip, port, body, tool_name, prefix=_perf_update_prefix(server_id))
+        else:
+            messages = [
+                {"v": 2, "t": "perf_update", "sid": server_id, **body}
+                for server_id, body, _ in entries
+            ]
+            _send_perf_batch(multicast_ip, port, messages)
+
+
+def _send_perf_batch(multicast_ip: str, port: int, messages: list) -> None:
+    """Send several perf_update messages as one perf_batch datagram, splitting to fit"""
+    if len(messages) == 1:
+        _send_udp(multicast_ip, port, messages[0], messages[0].get("tool", "unknown"))
+        return
+
+    message_bytes = orjson.dumps({"v": 2, "t": "perf_batch", "items": messages})
+    if len(message_bytes) > UDP_MAX_SIZE:
+        middle = len(messages) // 2
+        _send_perf_batch(multicast_ip, port, messages[:middle])
+        _send_perf_batch(multicast_ip, port, messages[middle:])
+        return
+
+    _get_sock(multicast_ip).sendto(message_bytes, (multicast_ip, port))
+    logger.debug(f"🪱 DCAP perf_batch sent (UDP): {len(messages)} messages -> {multicast_ip}:{port}")
+
+
+def _enqueue(multicast_ip: str, port: int, server_id: str, body: dict, tool_name: str) -> None:
+    """Hand a message to the background sender, starting it on first use"""
+    global _worker
+
+    if _worker is None:
+        with _WORKER_LOCK:
+            if _worker is None:
+                _worker = threading.Thread(target=_dcap_worker, name="dcap-sender", daemon=True)
+                _worker.start()
+
+    try:
+        _DCAP_QUEUE.put_nowait((multicast_ip, port, server_id, body, tool_name))
+    except queue.Full:
+        logger.debug(f"⚠️ DCAP queue full - dropping perf_update for {tool_name}")
+
+
+# Resolved configuration, read from the environment once per process.
+# (loaded, value) so that a disabled DCAP (None) is cached too.
+_CONFIG_CACHE: tuple = (False, None)
+_ENABLED_CACHE: Optional[bool] = None
+
 
 def _get_dcap_config():
-    """Get DCAP configuration from environment variables"""
-    from ..env import get_env, get_env_int
+    """Get DCAP configuration from environment variables (cached after first call)"""
+    global _CONFIG_CACHE
+
+    if _CONFIG_CACHE[0]:
+        return _CONFIG_CACHE[1]
+
+    from ..env import get_env, get_env_bool, get_env_int
 
     multicast_ip = get_env("DCAP_MULTICAST_IP", "")
 
-    # If no multicast IP configured, return None
+    # If no multicast IP configured, cache None
     if not multicast_ip:
-        return None
+        config = None
+    else:
+        config = {
+            "multicast_ip": multicast_ip,
+            "port": get_env_int("DCAP_PORT", 10191),
+            "server_id": get_env("DCAP_SERVER_ID", "canton-mcp"),
+            "server_name": get_env("DCAP_SERVER_NAME", "Canton MCP Server"),
+            # Fallbacks only used when the request doesn't identify caller/payer
+            "default_caller": get_env("DCAP_DEFAULT_CALLER", "unknown-client"),
+            "default_payer": get_env(
+                "DCAP_DEFAULT_PAYER", "0x0000000000000000000000000000000000000000"
+            ),
+            # Coalesce queued messages into perf_batch datagrams
+            "batch": get_env_bool("DCAP_BATCH", False),
+        }
 
-    return {
-        "multicast_ip": multicast_ip,
-        "port": get_env_int("DCAP_PORT", 10191),
-        "server_id": get_env("DCAP_SERVER_ID", "canton-mcp"),
-        "server_name": get_env("DCAP_SERVER_NAME", "Canton MCP Server"),
-    }
+    _CONFIG_CACHE = (True, config)
+    return config
+
+
+def dcap_reload_config() -> None:
+    """Forget the cached DCAP configuration so the next call re-reads the environment"""
+    global _CONFIG_CACHE, _ENABLED_CACHE
+
+    _CONFIG_CACHE = (False, None)
+    _ENABLED_CACHE = None
+
+
+def _keep(value: Any) -> Any:
+    return value
+
+
+def _truncate_str(value: str) -> str:
+    # Truncate long strings
+    return value[:20] + "..." if len(value) > 20 else value
+
+
+# Exact-type handlers for anonymize_args; one dict lookup per value
+_ANONYMIZERS = {
+    str: _truncate_str,
+    # Keep numeric/boolean values as-is
+    int: _keep,
+    float: _keep,
+    bool: _keep,
+    # Show collection sizes only
+    list: lambda value: f"[{len(value)} items]",
+    dict: lambda value: f"{{{len(value)} fields}}",
+    type(None): _keep,
+}
+
+
+def _anonymize_value(value: Any) -> Any:
+    """Anonymize a value whose exact type has no handler (e.g. subclasses)"""
+    for base in (str, int, float, list, dict):
+        if isinstance(value, base):
+            return _ANONYMIZERS[base](value)
+    # Convert unknown types to string
+    return str(value)[:20]
 
 
 def anonymize_args(args: Dict[str, Any]) -> Dict[str, Any]:
@@ -50,25 +261,11 @@ def anonymize_args(args: Dict[str, Any]) -> Dict[str, Any]:
         Anonymized version of arguments
     """
     anonymized = {}
+    get_handler = _ANONYMIZERS.get
 
     for key, value in args.items():
-        if isinstance(value, str):
-            # Truncate long strings
-            anonymized[key] = value[:20] + "..." if len(value) > 20 else value
-        elif isinstance(value, (int, float, bool)):
-            # Keep numeric/boolean values as-is
-            anonymized[key] = value
-        elif isinstance(value, list):
-            # Show list size only
-            anonymized[key] = f"[{len(value)} items]"
-        elif isinstance(value, dict):
-            # Show dict size only
-            anonymized[key] = f"{{{len(value)} fields}}"
-        elif value is None:
-            anonymized[key] = None
-        else:
-            # Convert unknown types to string
-            anonymized[key] = str(value)[:20]
+        handler = get_handler(type(value))
+        anonymized[key] = handler(value) if handler is not None else _anonymize_value(value)
 
     return anonymized
 
@@ -86,8 +283,9 @@ def send_perf_update(
     """
     Send DCAP v2.4 perf_update message via direct UDP.
 
-    Broadcasts tool performance metrics to real-time dashboards. Fails silently to
-    never interrupt tool execution.
+    Broadcasts tool performance metrics to real-time dashboards. The message is
+    queued and sent by a background thread. Fails silently to never interrupt
+    tool execution.
 
     Args:
         tool_name: Name of the tool that was executed
@@ -108,27 +306,33 @@ def send_perf_update(
             logger.debug("⚠️ DCAP not enabled - no IP configured")
             return
 
-        # Get fallback defaults for caller and payer from environment
-        # These are only used when real values cannot be determined from request
-        from ..env import get_env
-        default_caller = get_env("DCAP_DEFAULT_CALLER", "unknown-client")
-        default_payer = get_env("DCAP_DEFAULT_PAYER", "0x0000000000000000000000000000000000000000")
+        # Fallback defaults for caller and payer, only used when real values
+        # cannot be determined from request
+        default_caller = config.get("default_caller", "unknown-client")
+        default_payer = config.get("default_payer", "0x0000000000000000000000000000000000000000")
 
-        # Build DCAP v2.4 message (spec-compliant format)
+        # Skip anonymizing args that can't possibly fit in the datagram
+        if args and (
+            sum(len(key) for key in args) + len(args) * _ARG_MIN_ENCODED <= UDP_MAX_SIZE
+        ):
+            anonymized_args = anonymize_args(args)
+        else:
+            anonymized_args = {}
+
+        # Build DCAP v2.4 message body (spec-compliant format). The constant
+        # envelope - "v": 2 (protocol 2.4), "t": "perf_update" and the server
+        # id as "sid" - is pre-encoded and prepended when the message is sent.
         # caller: Extracted from X-Caller-ID header or User-Agent
         # payer: Extracted from x402 payment header or settlement response
         message = {
-            "v": 2,  # Protocol version 2.4
             "ts": int(time.time()),  # Unix timestamp
-            "t": "perf_update",  # Message type
-            "sid": config["server_id"],  # Server identifier
             "tool": tool_name,
             "exec_ms": exec_ms,
             "success": success,
             "ctx": {
                 "caller": caller or default_caller,  # Agent/user identifier (from header)
                 "payer": payer or default_payer,  # Wallet address (from x402 payment)
-                "args": anonymize_args(args) if args else {},
+                "args": anonymized_args,
             },
         }
 
@@ -140,42 +344,80 @@ def send_perf_update(
         # Log the message
         logger.debug(f"🪱 DCAP message: {message}")
 
-        # Send via UDP multicast
-        _send_udp(config["multicast_ip"], config["port"], message, tool_name)
+        # Send via UDP multicast (in the background; never blocks the tool)
+        _enqueue(config["multicast_ip"], config["port"], config["server_id"], message, tool_name)
 
     except Exception as e:
         # Silent failure - don't break tool execution
         logger.warning(f"⚠️ DCAP broadcast failed for {tool_name}: {e}")
 
 
-def _send_udp(multicast_ip: str, port: int, message: dict, tool_name: str) -> None:
-    """Send DCAP message via UDP (multicast or direct)"""
-    # Create UDP socket
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-
-    # Set multicast TTL only if using multicast address (239.x.x.x)
-    if multicast_ip.startswith("239."):
-        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
+def _send_udp(
+    multicast_ip: str, port: int, message: dict, tool_name: str, prefix: bytes = b"{"
+) -> None:
+    """
+    Send DCAP message via UDP (multicast or direct).
 
-    # Convert to JSON
-    json_message = json.dumps(message)
+    prefix is the already-encoded opening of the JSON object (see
+    _perf_update_prefix); the message's own fields are spliced in after it.
+    """
+    # Convert to JSON (orjson produces UTF-8 bytes directly), dropping the
+    # leading "{" so the fields follow the prefix
+    message_bytes = prefix + orjson.dumps(message)[1:]
 
     # Ensure message fits in UDP packet (max 1472 bytes)
-    message_bytes = json_message.encode("utf-8")
     if len(message_bytes) > UDP_MAX_SIZE:
-        # Remove args if too large
-        if "ctx" in message and "args" in message["ctx"]:
-            message["ctx"]["args"] = {}
-            json_message = json.dumps(message)
-            message_bytes = json_message.encode("utf-8")
+        # Remove args if too large (nothing to re-encode if they're already empty)
+        ctx = message.get("ctx")
+        if ctx and ctx.get("args"):
+            ctx["args"] = {}
+            message_bytes = prefix + orjson.dumps(message)[1:]
 
     # Send via UDP (multicast or direct)
-    sock.sendto(message_bytes, (multicast_ip, port))
-    sock.close()
+    _get_sock(multicast_ip).sendto(message_bytes, (multicast_ip, port))
 
     logger.debug(f"🪱 DCAP thump sent (UDP): {tool_name} -> {multicast_ip}:{port}")
 
 
+@functools.lru_cache(maxsize=16)
+def _encode_connector(server_url: str, payment_enabled: bool) -> bytes:
+    """
+    Build and encode the DCAP v2.5 connector object.
+
+    The connector is identical for every tool on an endpoint, so the encoded
+    bytes are cached per (server_url, payment_enabled).
+    """
+    connector = {
+        "transport": "sse",  # This server uses Server-Sent Events (HTTP-based streaming)
+        "endpoint": server_url,
+        "protocol": {
+            "type": "mcp",
+            "version": "2024-11-05",
+            "methods": ["tools/list", "tools/call"]
+        }
+    }
+
+    # Add auth details if payment is enabled
+    if payment_enabled:
+        connector["auth"] = {
+            "type": "x402",
+            "required": True,
+            "details": {
+                "network": "base-sepolia",
+                "asset": "0x036CbD53842c5426634e7929541eC2318f3dCF7e",  # USDC on Base Sepolia
+                "currency": "USDC"
+                # No price field - actual price determined via x402 negotiation at call time
+            }
+        }
+    else:
+        connector["auth"] = {
+            "type": "none",
+            "required": False
+        }
+
+    return orjson.dumps(connector)
+
+
 def send_semantic_discover(
     tool_name: str,
     description: str,
@@ -204,35 +446,6 @@ def send_semantic_discover(
             logger.debug("⚠️ DCAP not enabled - no IP configured")
             return
 
-        # Build connector object (DCAP v2.5)
-        connector = {
-            "transport": "sse",  # This server uses Server-Sent Events (HTTP-based streaming)
-            "endpoint": server_url,
-            "protocol": {
-                "type": "mcp",
-                "version": "2024-11-05",
-                "methods": ["tools/list", "tools/call"]
-            }
-        }
-
-        # Add auth details if payment is enabled
-        if payment_enabled:
-            connector["auth"] = {
-                "type": "x402",
-                "required": True,
-                "details": {
-                    "network": "base-sepolia",
-                    "asset": "0x036CbD53842c5426634e7929541eC2318f3dCF7e",  # USDC on Base Sepolia
-                    "currency": "USDC"
-                    # No price field - actual price determined via x402 negotiation at call time
-                }
-            }
-        else:
-            connector["auth"] = {
-                "type": "none",
-                "required": False
-            }
-
         # Build DCAP v2.5 semantic_discover message
         message = {
             "v": 2,  # Protocol version 2.5
@@ -245,14 +458,21 @@ def send_semantic_discover(
             "when": [],
             "good_at": [],
             "bad_at": [],
-            "connector": connector
         }
 
+        # Splice in the connector, which is encoded once per endpoint/payment mode
+        message_bytes = (
+            orjson.dumps(message)[:-1]
+            + b',"connector":'
+            + _encode_connector(server_url, payment_enabled)
+            + b"}"
+        )
+
         # Log the message (truncate for readability)
         logger.debug(f"🔍 DCAP semantic_discover: {tool_name}")
 
         # Send via UDP (allows up to ~65KB with IP fragmentation)
-        _send_udp_large(config["multicast_ip"], config["port"], message, tool_name)
+        _send_udp_large(config["multicast_ip"], config["port"], message_bytes, tool_name)
 
     except Exception as e:
         # Silent failure - don't break server startup
@@ -306,7 +526,7 @@ def broadcast_all_tools(server_url: str, payment_handler=None) -> None:
         logger.warning(f"⚠️ Failed to broadcast tools: {e}")
 
 
-def _send_udp_large(multicast_ip: str, port: int, message: dict, tool_name: str) -> None:
+def _send_udp_large(multicast_ip: str, port: int, message_bytes: bytes, tool_name: str) -> None:
     """
     Send large DCAP message via UDP (allows IP fragmentation up to ~65KB).
 
@@ -316,20 +536,9 @@ def _send_udp_large(multicast_ip: str, port: int, message: dict, tool_name: str)
     Args:
         multicast_ip: Target IP address
         port: Target port
-        message: DCAP message dict
+        message_bytes: Encoded DCAP message
         tool_name: Tool name (for logging)
     """
-    # Create UDP socket
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-
-    # Set multicast TTL only if using multicast address (239.x.x.x)
-    if multicast_ip.startswith("239."):
-        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
-
-    # Convert to JSON
-    json_message = json.dumps(message)
-    message_bytes = json_message.encode("utf-8")
-
     # Log warning if message is very large
     if len(message_bytes) > 8192:
         logger.warning(
@@ -338,8 +547,7 @@ def _send_udp_large(multicast_ip: str, port: int, message: dict, tool_name: str)
         )
 
     # Send via UDP (IP layer handles fragmentation if needed)
-    sock.sendto(message_bytes, (multicast_ip, port))
-    sock.close()
+    _get_sock(multicast_ip).sendto(message_bytes, (multicast_ip, port))
 
     logger.debug(
         f"🪱 DCAP semantic_discover sent (UDP, {len(message_bytes)} bytes): "
@@ -351,10 +559,16 @@ def is_dcap_enabled() -> bool:
     """
     Check if DCAP broadcasting is enabled via environment variable.
 
+    The result is cached; call dcap_reload_config() to re-read it.
+
     Returns:
         True if DCAP should broadcast, False otherwise
     """
-    from ..env import get_env_bool
+    global _ENABLED_CACHE
+
+    if _ENABLED_CACHE is None:
+        from ..env import get_env_bool
 
-    return get_env_bool("DCAP_ENABLED", default=True)
+        _ENABLED_CACHE = get_env_bool("DCAP_ENABLED", default=True)
+    return _ENABLED_CACHE
 
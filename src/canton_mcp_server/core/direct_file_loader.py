@@ -9,26 +9,48 @@ Features:
 - Hot-reload support with git pull detection
 """
 
+import gzip
+import hashlib
 import subprocess
 import logging
-import json
-import time
-from typing import Dict, List, Any, Optional
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+
+import orjson
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
+try:
+    # Optional: in-process git object access (pip install pygit2)
+    import pygit2
+    _PYGIT2_AVAILABLE = True
+except ImportError:
+    _PYGIT2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _compute_blob_hash(data: bytes) -> str:
+    """Git blob hash of file contents, as `git hash-object` computes it"""
+    h = hashlib.sha1(b"blob %d\0" % len(data))
+    h.update(data)
+    return h.hexdigest()
+
+
 class CanonicalRepoFileHandler(FileSystemEventHandler):
     """Handles file system events for canonical repository hot-reloading"""
     
     def __init__(self, loader: 'DirectFileResourceLoader'):
         self.loader = loader
-        self.last_check = 0
         self.check_delay = 2.0  # Debounce git pulls by 2 seconds
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
     
     def on_any_event(self, event):
         """Handle any file system event in canonical repos"""
@@ -39,14 +61,28 @@ class CanonicalRepoFileHandler(FileSystemEventHandler):
         if ".git" in str(event.src_path):
             return
         
-        # Debounce rapid changes (like git pull with many files)
-        current_time = time.time()
-        if current_time - self.last_check < self.check_delay:
-            return
-        
-        self.last_check = current_time
-        
-        logger.info(f"Canonical repo file changed: {event.src_path}")
+        logger.debug(f"Canonical repo file changed: {event.src_path}")
+        
+        # Trailing-edge debounce: every event in a burst (like a git pull
+        # touching many files) restarts the timer, so the check runs once,
+        # after the last change has landed
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.check_delay, self._check_for_changes)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def cancel(self) -> None:
+        """Cancel a pending debounced check"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+    
+    def _check_for_changes(self) -> None:
+        """Run the commit check once the debounce window has passed"""
+        logger.info("Canonical repo files changed - checking for new commits")
         
         # Check if commit hashes changed
         try:
@@ -65,6 +101,22 @@ class DirectFileResourceLoader:
     - Git verification of all files
     """
     
+    # File path keywords per resource type, checked in order by _categorize_resource
+    _CATEGORY_KEYWORDS = (
+        ("patterns", ("pattern", "example", "template")),
+        ("anti_patterns", ("anti-pattern", "bad", "wrong", "avoid")),
+        ("rules", ("rule", "policy", "guideline")),
+    )
+    
+    # One compiled alternation per resource type, so each type is a single search
+    _CATEGORY_PATTERNS = tuple(
+        (resource_type, re.compile("|".join(map(re.escape, keywords))))
+        for resource_type, keywords in _CATEGORY_KEYWORDS
+    )
+    
+    # Characters replaced by "-" in generated resource names
+    _NAME_SEPARATORS = str.maketrans({"_": "-", " ": "-"})
+    
     def __init__(self, canonical_docs_path: Path, enable_hot_reload: bool = False):
         """
         Initialize the direct file loader.
@@ -85,11 +137,24 @@ class DirectFileResourceLoader:
         
         # In-memory cache for scanned resources
         self._cached_resources: Dict[str, List[Dict[str, Any]]] = {}
+        
+        # (resource_type, name) -> resource for the resources above
+        self._resource_by_name: Dict[Tuple[str, str], Dict[str, Any]] = {}
         self._cache_timestamp: Optional[datetime] = None
         self._current_commit_hashes: Dict[str, str] = {}
         
+        # ISO timestamp of the scan that produced the current resources
+        self.scanned_at: Optional[str] = None
+        
+        # Commit hashes memoized by the stat signature of each repo's git refs
+        self._commit_hash_memo: Dict[str, Tuple[Tuple, str]] = {}
+        
+        # Latest blob hash index per repository, as (commit_hash, index)
+        self._blob_index_memo: Dict[str, Tuple[str, Dict[str, str]]] = {}
+        
         # Hot-reload file watcher
         self.observer: Optional[Observer] = None
+        self._event_handler: Optional[CanonicalRepoFileHandler] = None
         
         # Disk cache directory
         self.cache_dir = Path.home() / ".canton-mcp"
@@ -105,6 +170,11 @@ class DirectFileResourceLoader:
             ".yml",     # YAML files
         }
         
+        # Directories never descended into when walking a working tree
+        self.skip_directories = {
+            ".git", "node_modules", "target", "build", "dist", ".venv", "__pycache__"
+        }
+        
         # Build/template file extensions (filter out)
         self.build_extensions = {
             ".py", ".js", ".css", ".html", ".conf", ".ini", ".toml", ".lock", ".log"
@@ -121,6 +191,17 @@ class DirectFileResourceLoader:
             ".pb", ".pem", ".key", ".crt", ".der", ".p12",    # Certs/protobuf
             ".wasm", ".pyc", ".pyo",                           # Other compiled
         }
+        
+        # Documentation files without extensions
+        self.doc_filenames = {"readme", "license", "changelog", "contributing", "authors"}
+        
+        # Extension -> accept/reject, combining the sets above so
+        # classification is one dict lookup
+        self._extension_decisions: Dict[str, bool] = {
+            **dict.fromkeys(self.build_extensions, False),
+            **dict.fromkeys(self.binary_extensions, False),
+            **dict.fromkeys(self.doc_extensions, True),
+        }
     
     def scan_repositories(self, force_refresh: bool = False) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -148,7 +229,7 @@ class DirectFileResourceLoader:
             cached_resources = self._load_from_disk_cache(commit_hashes)
             if cached_resources is not None:
                 logger.info(f"Loaded {sum(len(r) for r in cached_resources.values())} resources from disk cache")
-                self._cached_resources = cached_resources
+                self._set_cached_resources(cached_resources)
                 self._cache_timestamp = datetime.utcnow()
                 
                 # Start hot-reload watcher if enabled
@@ -159,6 +240,7 @@ class DirectFileResourceLoader:
         
         # No cache available or forced refresh - do full scan
         logger.info("Scanning cloned repositories for documentation files...")
+        scanned_at = datetime.utcnow().isoformat() + "Z"
         
         resources = {
             "patterns": [],
@@ -167,25 +249,45 @@ class DirectFileResourceLoader:
             "docs": []
         }
         
+        repos_to_scan = []
         for repo_name, repo_path in self.repos.items():
             if not repo_path.exists():
                 logger.warning(f"Repository not found: {repo_path}")
                 continue
-            
+            repos_to_scan.append((repo_name, repo_path))
+        
+        # Resources from the previous scan, by repo and path; files whose blob
+        # hash is unchanged (e.g. most files after a git pull) are reused
+        # instead of being read again
+        previous: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for resource in chain.from_iterable(self._cached_resources.values()):
+            if resource.get("canonical_hash"):
+                previous.setdefault(resource["source_repo"], {})[resource["file_path"]] = resource
+        
+        def scan(repo: Tuple[str, Path]) -> List[Dict[str, Any]]:
+            repo_name, repo_path = repo
             logger.info(f"Scanning repository: {repo_name}")
-            repo_resources = self._scan_repository(repo_path, repo_name)
-            
-            # Categorize resources by type
-            for resource in repo_resources:
-                resource_type = self._categorize_resource(resource)
-                resources[resource_type].append(resource)
+            return self._scan_repository(
+                repo_path, repo_name, commit_hashes.get(repo_name), previous.get(repo_name)
+            )
+        
+        # Repositories are scanned concurrently - the work is mostly file
+        # reads and git subprocesses, which release the GIL
+        with ThreadPoolExecutor(max_workers=max(len(repos_to_scan), 1)) as executor:
+            # map() yields in submission order, keeping resource order stable
+            for repo_resources in executor.map(scan, repos_to_scan):
+                # Categorize resources by type
+                for resource in repo_resources:
+                    resource_type = self._categorize_resource(resource)
+                    resources[resource_type].append(resource)
         
         total_resources = sum(len(resource_list) for resource_list in resources.values())
         logger.info(f"Found {total_resources} documentation files across all repositories")
         
         # Save to both in-memory and disk cache
-        self._cached_resources = resources
+        self._set_cached_resources(resources)
         self._cache_timestamp = datetime.utcnow()
+        self.scanned_at = scanned_at
         self._save_to_disk_cache(resources, commit_hashes)
         
         # Trigger LLM enrichment if enabled (non-blocking, runs in background)
@@ -197,13 +299,34 @@ class DirectFileResourceLoader:
         
         return resources
     
-    def _scan_repository(self, repo_path: Path, repo_name: str) -> List[Dict[str, Any]]:
+    def _set_cached_resources(self, resources: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Store scanned resources in memory and index them by name"""
+        self._cached_resources = resources
+        
+        index = {}
+        for resource_type, resource_list in resources.items():
+            for resource in resource_list:
+                # First resource with a given name wins, as with a linear search
+                index.setdefault((resource_type, resource.get("name")), resource)
+        self._resource_by_name = index
+    
+    def _scan_repository(
+        self,
+        repo_path: Path,
+        repo_name: str,
+        commit_hash: Optional[str] = None,
+        previous: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Scan a single repository for documentation files.
         
         Args:
             repo_path: Path to the repository
             repo_name: Name of the repository
+            commit_hash: HEAD commit already resolved by the caller; if None,
+                it is resolved here with `git rev-parse`
+            previous: Resources from an earlier scan of this repository, keyed
+                by file path; reused when the file's blob hash is unchanged
             
         Returns:
             List of file resources found in the repository
@@ -211,22 +334,44 @@ class DirectFileResourceLoader:
         resources = []
         
         try:
-            # Get current commit hash
-            commit_hash = self._get_current_commit_hash(repo_path)
+            # Reuse the commit hash resolved for the cache key when available
+            if not commit_hash:
+                commit_hash = self._get_current_commit_hash(repo_path)
             if not commit_hash:
                 logger.warning(f"Could not get commit hash for {repo_name} — scanning without git verification")
                 commit_hash = "unknown"
             
-            # Scan for documentation files (skip .git directory)
-            for file_path in repo_path.rglob("*"):
-                # Skip .git directory and its contents
-                if ".git" in file_path.parts:
-                    continue
-                    
-                if file_path.is_file() and self._is_documentation_file(file_path):
-                    resource = self._create_file_resource(file_path, repo_path, repo_name, commit_hash)
-                    if resource:
-                        resources.append(resource)
+            # Blob hashes for every tracked file, from a single git ls-tree
+            blob_index = None
+            if commit_hash != "unknown":
+                blob_index = self._get_blob_hash_index(repo_path, commit_hash)
+            
+            if blob_index is not None:
+                # Enumerate the files git tracks at this commit: no directory
+                # walk, no stat calls, and untracked build output is never seen.
+                # Names are filtered as strings; Paths are only built for matches
+                doc_files = [
+                    repo_path / relative_path for relative_path in blob_index
+                    if self._is_documentation_name(relative_path.rpartition("/")[2])
+                ]
+            else:
+                # No git metadata - walk the working tree
+                doc_files = list(self._walk_working_tree(repo_path))
+            
+            # Documentation files are read on a thread pool (reads release the GIL);
+            # map() keeps the results in enumeration order
+            
+            def create(file_path: Path) -> Optional[Dict[str, Any]]:
+                if previous and blob_index:
+                    relative_path = file_path.relative_to(repo_path)
+                    earlier = previous.get(str(relative_path))
+                    blob_hash = blob_index.get(relative_path.as_posix())
+                    if earlier is not None and earlier["canonical_hash"] == blob_hash:
+                        return {**earlier, "source_commit": commit_hash}
+                return self._create_file_resource(file_path, repo_path, repo_name, commit_hash, blob_index)
+            
+            with ThreadPoolExecutor() as executor:
+                resources = [resource for resource in executor.map(create, doc_files) if resource]
             
             logger.info(f"Found {len(resources)} documentation files in {repo_name}")
             
@@ -235,6 +380,33 @@ class DirectFileResourceLoader:
         
         return resources
     
+    def _walk_working_tree(self, root: Path):
+        """
+        Yield documentation files under root, pruning VCS and build directories.
+        
+        Uses os.scandir so directories like .git are skipped before they are
+        descended into, and file types come from the directory listing. Names
+        are filtered before a Path is built for the entry.
+        
+        Args:
+            root: Directory to walk
+            
+        Yields:
+            Paths of documentation files found
+        """
+        stack = [str(root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.skip_directories:
+                                stack.append(entry.path)
+                        elif self._is_documentation_name(entry.name) and entry.is_file():
+                            yield Path(entry.path)
+            except OSError as e:
+                logger.debug(f"Skipping unreadable directory: {e}")
+    
     def _is_documentation_file(self, file_path: Path) -> bool:
         """
         Check if a file is a documentation file based on extension and path.
@@ -245,38 +417,49 @@ class DirectFileResourceLoader:
         Returns:
             True if file appears to be documentation, False otherwise
         """
-        # Check file extension
-        file_ext = file_path.suffix.lower()
-        
-        # Allow documentation extensions
-        if file_ext in self.doc_extensions:
-            return True
-        
-        # Reject build file extensions
-        if file_ext in self.build_extensions:
-            return False
+        return self._is_documentation_name(file_path.name)
+    
+    def _is_documentation_name(self, filename: str) -> bool:
+        """
+        Check if a file name is a documentation file name.
         
-        # Reject binary file extensions
-        if file_ext in self.binary_extensions:
-            return False
+        Works on the bare name string so paths can be filtered before any
+        Path object is built.
         
-        # Special cases for files without extensions
-        if not file_ext:
-            filename = file_path.name.lower()
-            
-            # Documentation files without extensions
-            if filename in {"readme", "license", "changelog", "contributing", "authors"}:
-                return True
+        Args:
+            filename: Final path component
             
-            # Build files without extensions
-            if filename in {"makefile", "dockerfile", "docker-compose", "sphinx", "conf"}:
-                return False
+        Returns:
+            True if file appears to be documentation, False otherwise
+        """
+        # Same rule as Path.suffix: a leading or trailing dot is no extension
+        dot = filename.rfind(".")
+        file_ext = filename[dot:].lower() if 0 < dot < len(filename) - 1 else ""
+        
+        # Known extensions resolve with a single lookup (doc -> True,
+        # build/binary -> False)
+        decision = self._extension_decisions.get(file_ext)
+        if decision is not None:
+            return decision
+        
+        # Special cases for files without extensions: documentation files
+        # like README are accepted; everything else (Makefile, Dockerfile...)
+        # is rejected
+        if not file_ext:
+            return filename.lower() in self.doc_filenames
         
         # Default: reject files with unknown extensions (deny-by-default)
         # Only explicitly allowed extensions (doc_extensions) are accepted
         return False
     
-    def _create_file_resource(self, file_path: Path, repo_path: Path, repo_name: str, commit_hash: str) -> Optional[Dict[str, Any]]:
+    def _create_file_resource(
+        self,
+        file_path: Path,
+        repo_path: Path,
+        repo_name: str,
+        commit_hash: str,
+        blob_index: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Create a resource dictionary for a documentation file.
         
@@ -285,6 +468,7 @@ class DirectFileResourceLoader:
             repo_path: Path to the repository root
             repo_name: Name of the repository
             commit_hash: Current commit hash
+            blob_index: Mapping of repo-relative POSIX paths to git blob hashes
             
         Returns:
             Resource dictionary or None if creation failed
@@ -294,40 +478,64 @@ class DirectFileResourceLoader:
             relative_path = file_path.relative_to(repo_path)
             relative_path_str = str(relative_path)
             
-            # Get Git blob hash for verification (skip when no git repo)
+            # Get Git blob hash for verification (computed from the file
+            # contents below when there is no git repo)
             if commit_hash == "unknown":
                 blob_hash = None
             else:
-                blob_hash = self._get_git_blob_hash(repo_path, commit_hash, relative_path_str)
+                blob_hash = (blob_index or {}).get(relative_path.as_posix())
                 if not blob_hash:
                     logger.warning(f"Could not get blob hash for {relative_path_str}")
                     return None
             
             # Read file content
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                with open(file_path, 'rb') as f:
+                    # A NUL byte in the first block means binary content
+                    # under a doc-like name; stop before reading the rest
+                    head = f.read(4096)
+                    if b"\0" in head:
+                        logger.warning(f"Skipping binary file: {relative_path_str}")
+                        return None
+                    rest = f.read()
+                data = head + rest if rest else head
+                content = data.decode('utf-8')
+                if '\r' in content:
+                    # Match text-mode universal newline handling
+                    content = content.replace('\r\n', '\n').replace('\r', '\n')
             except UnicodeDecodeError:
                 logger.warning(f"Could not read file as UTF-8: {relative_path_str}")
                 return None
+            except (FileNotFoundError, IsADirectoryError):
+                # Tracked at the commit but missing from the working tree
+                logger.debug(f"Skipping tracked file not present on disk: {relative_path_str}")
+                return None
+            
+            # Per-file content hash so consumers (e.g. LLM enrichment) can skip
+            # files whose bytes are unchanged regardless of the repo commit
+            content_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
             
-            # Create resource
+            if blob_hash is None:
+                # Same hash git would assign, so untracked checkouts still
+                # carry a canonical hash comparable with the upstream repo
+                blob_hash = _compute_blob_hash(data)
+            
+            # Create resource (the scan time is kept once on the loader as
+            # scanned_at, not repeated per file)
             resource = {
                 "name": self._generate_resource_name(file_path, repo_name),
                 "version": "1.0.0",
                 "description": f"Canonical documentation from {repo_name}: {relative_path_str}",
                 "tags": [repo_name, "canonical", "documentation", "git-verified"],
                 "author": "Digital Asset",
-                "created_at": datetime.utcnow().isoformat() + "Z",
-                "updated_at": datetime.utcnow().isoformat() + "Z",
                 "content": content,
                 "file_path": relative_path_str,
                 "file_extension": file_path.suffix.lower(),
                 "canonical_hash": blob_hash,
+                "content_hash": content_hash,
                 "source_commit": commit_hash,
                 "source_file": relative_path_str,
-                "source_repo": repo_name,
-                "extracted_at": datetime.utcnow().isoformat() + "Z"
+                "source_repo": repo_name
             }
             
             return resource
@@ -339,8 +547,7 @@ class DirectFileResourceLoader:
     def _generate_resource_name(self, file_path: Path, repo_name: str) -> str:
         """Generate a resource name from file path and repo name."""
         # Remove extension and convert to resource name
-        name = file_path.stem.lower()
-        name = name.replace("_", "-").replace(" ", "-")
+        name = file_path.stem.lower().translate(self._NAME_SEPARATORS)
         return f"{repo_name}-{name}"
     
     def _categorize_resource(self, resource: Dict[str, Any]) -> str:
@@ -355,62 +562,161 @@ class DirectFileResourceLoader:
         """
         file_path = resource.get("file_path", "").lower()
         
-        # Categorize based on file path patterns
-        if any(pattern in file_path for pattern in ["pattern", "example", "template"]):
-            return "patterns"
-        elif any(pattern in file_path for pattern in ["anti-pattern", "bad", "wrong", "avoid"]):
-            return "anti_patterns"
-        elif any(pattern in file_path for pattern in ["rule", "policy", "guideline"]):
-            return "rules"
-        else:
-            return "docs"
+        # Categorize based on file path patterns (first match wins)
+        for resource_type, pattern in self._CATEGORY_PATTERNS:
+            if pattern.search(file_path):
+                return resource_type
+        return "docs"
     
     def _get_current_commit_hash(self, repo_path: Path) -> Optional[str]:
         """Get the current commit hash for a repository."""
+        # Plain repositories: read HEAD and its ref without spawning git
+        commit_hash = self._read_head_commit(repo_path)
+        if commit_hash:
+            return commit_hash
+        
+        # Worktrees, submodules etc.: let libgit2 resolve HEAD in-process
+        if _PYGIT2_AVAILABLE:
+            try:
+                return str(pygit2.Repository(str(repo_path)).head.target)
+            except Exception as e:
+                logger.debug(f"pygit2 could not resolve HEAD for {repo_path}, using git: {e}")
+        
         try:
             result = subprocess.run(
                 ["git", "rev-parse", "HEAD"],
                 cwd=repo_path,
                 capture_output=True,
-                text=True,
                 check=True
             )
-            return result.stdout.strip()
+            # Hex object name - no need for locale-aware text decoding
+            return result.stdout.strip().decode("ascii")
         except subprocess.CalledProcessError as e:
             logger.error(f"Failed to get commit hash: {e}")
             return None
     
-    def _get_git_blob_hash(self, repo_path: Path, commit_hash: str, file_path: str) -> Optional[str]:
-        """Get the Git blob hash for a specific file at a given commit."""
+    def _read_head_commit(self, repo_path: Path) -> Optional[str]:
+        """
+        Resolve HEAD by reading `.git/HEAD`, the loose ref and `packed-refs`.
+        
+        Args:
+            repo_path: Path to the repository
+            
+        Returns:
+            Commit hash, or None if it can't be read directly (worktrees,
+            submodules, unusual ref layouts) and git should be asked instead
+        """
+        git_dir = repo_path / ".git"
         try:
-            # Get tree hash
-            result = subprocess.run(
-                ["git", "show", "--format=%T", "-s", commit_hash],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            tree_hash = result.stdout.strip()
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
             
-            # Get blob hash
+            if not head.startswith("ref: "):
+                # Detached HEAD holds the commit hash itself
+                commit_hash = head
+            else:
+                ref = head[5:]
+                try:
+                    commit_hash = (git_dir / ref).read_text(encoding="utf-8").strip()
+                except FileNotFoundError:
+                    # Ref has been packed: "<hash> <ref>" lines in packed-refs
+                    commit_hash = None
+                    with open(git_dir / "packed-refs", encoding="utf-8") as f:
+                        for line in f:
+                            hash_part, _, name = line.rstrip("\n").partition(" ")
+                            if name == ref:
+                                commit_hash = hash_part
+                                break
+        except OSError:
+            return None
+        
+        # Only trust full SHA-1/SHA-256 object names
+        if commit_hash and len(commit_hash) in (40, 64) and all(
+            c in "0123456789abcdef" for c in commit_hash
+        ):
+            return commit_hash
+        return None
+    
+    def _get_blob_hash_index(self, repo_path: Path, commit_hash: str) -> Dict[str, str]:
+        """
+        Get the Git blob hash of every tracked file at a given commit.
+        
+        Walks the commit's tree in-process with pygit2 when it is installed,
+        otherwise runs a single `git ls-tree -r -z` per repository instead of
+        spawning git subprocesses for each file. The index of a repository's
+        latest commit is kept, so rescans at the same commit reuse it.
+        
+        Args:
+            repo_path: Path to the repository
+            commit_hash: Commit to list
+            
+        Returns:
+            Dictionary mapping repo-relative POSIX paths to blob hashes
+        """
+        memo = self._blob_index_memo.get(str(repo_path))
+        if memo is not None and memo[0] == commit_hash:
+            return memo[1]
+        
+        index = self._list_blob_hashes(repo_path, commit_hash)
+        if index:
+            self._blob_index_memo[str(repo_path)] = (commit_hash, index)
+        return index
+    
+    def _list_blob_hashes(self, repo_path: Path, commit_hash: str) -> Dict[str, str]:
+        """List blob hashes at a commit, with pygit2 or `git ls-tree`"""
+        if _PYGIT2_AVAILABLE:
+            try:
+                return self._get_blob_hash_index_pygit2(repo_path, commit_hash)
+            except Exception as e:
+                logger.debug(f"pygit2 tree walk failed for {repo_path}, using git ls-tree: {e}")
+        
+        try:
             result = subprocess.run(
-                ["git", "ls-tree", tree_hash, file_path],
+                ["git", "ls-tree", "-r", "-z", commit_hash],
                 cwd=repo_path,
                 capture_output=True,
-                text=True,
                 check=True
             )
-            
-            if result.stdout.strip():
-                blob_hash = result.stdout.strip().split()[2]
-                return blob_hash
-            
-            return None
-            
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to get blob hash for {file_path}: {e}")
-            return None
+            logger.error(f"Failed to list blob hashes for {repo_path}: {e}")
+            return {}
+        
+        # Entries are "<mode> <type> <hash>\t<path>\0"
+        index = {}
+        for entry in result.stdout.split(b"\0"):
+            meta, _, path = entry.partition(b"\t")
+            parts = meta.split()
+            if len(parts) == 3 and parts[1] == b"blob":
+                index[os.fsdecode(path)] = parts[2].decode("ascii")
+        
+        return index
+    
+    def _get_blob_hash_index_pygit2(self, repo_path: Path, commit_hash: str) -> Dict[str, str]:
+        """
+        Build the blob hash index by walking the commit tree with pygit2.
+        
+        Args:
+            repo_path: Path to the repository
+            commit_hash: Commit to list
+            
+        Returns:
+            Dictionary mapping repo-relative POSIX paths to blob hashes, in
+            path order like `git ls-tree`
+        """
+        repo = pygit2.Repository(str(repo_path))
+        root = repo.revparse_single(commit_hash).peel(pygit2.Tree)
+        
+        index = {}
+        stack = [("", root)]
+        while stack:
+            prefix, tree = stack.pop()
+            for entry in tree:
+                path = prefix + entry.name
+                if entry.type_str == "tree":
+                    stack.append((path + "/", repo[entry.id]))
+                elif entry.type_str == "blob":
+                    index[path] = str(entry.id)
+        
+        return dict(sorted(index.items()))
     
     def get_resource_by_name(self, name: str, resource_type: str) -> Optional[Dict[str, Any]]:
         """
@@ -423,16 +729,10 @@ class DirectFileResourceLoader:
         Returns:
             Resource dictionary or None if not found
         """
-        all_resources = self.scan_repositories()
+        # Makes sure resources (and the name index) are loaded
+        self.scan_repositories()
         
-        if resource_type not in all_resources:
-            return None
-        
-        for resource in all_resources[resource_type]:
-            if resource.get("name") == name:
-                return resource
-        
-        return None
+        return self._resource_by_name.get((resource_type, name))
     
     def verify_all_resources(self) -> Dict[str, List[str]]:
         """
@@ -474,22 +774,84 @@ class DirectFileResourceLoader:
     
     def _get_all_commit_hashes(self) -> Dict[str, str]:
         """Get current commit hashes for all repositories."""
+        return self.get_commit_hashes_fast()
+    
+    def get_commit_hashes_fast(self) -> Dict[str, str]:
+        """
+        Get current commit hashes for all repositories, avoiding git subprocesses
+        when the repository refs are unchanged.
+        
+        Each repository's `.git/HEAD`, the ref it points to and `.git/packed-refs`
+        are stat'ed; if their (mtime, size) signature matches the previous lookup,
+        the memoized commit hash is returned without spawning `git rev-parse`.
+        
+        Returns:
+            Dictionary mapping repository names to commit hashes
+        """
         commit_hashes = {}
         
         for repo_name, repo_path in self.repos.items():
-            if repo_path.exists():
-                commit_hash = self._get_current_commit_hash(repo_path)
-                if commit_hash:
-                    commit_hashes[repo_name] = commit_hash
+            if not repo_path.exists():
+                continue
+            
+            signature = self._get_ref_signature(repo_path)
+            memo = self._commit_hash_memo.get(repo_name)
+            if signature is not None and memo is not None and memo[0] == signature:
+                commit_hashes[repo_name] = memo[1]
+                continue
+            
+            commit_hash = self._get_current_commit_hash(repo_path)
+            if commit_hash:
+                commit_hashes[repo_name] = commit_hash
+                if signature is not None:
+                    self._commit_hash_memo[repo_name] = (signature, commit_hash)
         
         return commit_hashes
     
+    def _get_ref_signature(self, repo_path: Path) -> Optional[Tuple]:
+        """
+        Build a cheap stat-based signature of a repository's current ref state.
+        
+        Args:
+            repo_path: Path to the repository
+            
+        Returns:
+            Tuple of (mtime_ns, size) pairs, or None if the git dir can't be inspected
+        """
+        git_dir = repo_path / ".git"
+        if not git_dir.is_dir():
+            # Worktrees/submodules use a .git file - fall back to git itself
+            return None
+        
+        try:
+            head_file = git_dir / "HEAD"
+            head_stat = head_file.stat()
+            head = head_file.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        
+        signature = [(head_stat.st_mtime_ns, head_stat.st_size)]
+        ref_files = [git_dir / "packed-refs"]
+        if head.startswith("ref: "):
+            ref_files.insert(0, git_dir / head[5:])
+        
+        for ref_file in ref_files:
+            try:
+                st = ref_file.stat()
+                signature.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+            except OSError:
+                return None
+        
+        return tuple(signature)
+    
     def _get_cache_filename(self, commit_hashes: Dict[str, str]) -> str:
         """Generate cache filename based on commit hashes."""
         # Sort for consistency
         hash_parts = [f"{repo}-{commit_hashes.get(repo, 'none')[:8]}" 
                      for repo in sorted(self.repos.keys())]
-        return f"resource-cache-{'-'.join(hash_parts)}.json"
+        return f"resource-cache-{'-'.join(hash_parts)}.json.gz"
     
     def _load_from_disk_cache(self, commit_hashes: Dict[str, str]) -> Optional[Dict[str, List[Dict[str, Any]]]]:
         """
@@ -503,13 +865,22 @@ class DirectFileResourceLoader:
         """
         cache_file = self.cache_dir / self._get_cache_filename(commit_hashes)
         
-        if not cache_file.exists():
+        try:
+            # One read of the compressed bytes and one decompress call: avoids
+            # GzipFile's chunked reads and the join of the decompressed chunks
+            compressed = cache_file.read_bytes()
+        except FileNotFoundError:
             logger.debug(f"No disk cache found at {cache_file}")
             return None
+        except OSError as e:
+            logger.error(f"Failed to load disk cache: {e}")
+            return None
         
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            raw = gzip.decompress(compressed)
+            del compressed
+            cache_data = orjson.loads(raw)
+            del raw
             
             # Verify commit hashes match
             cached_hashes = cache_data.get("commit_hashes", {})
@@ -518,6 +889,7 @@ class DirectFileResourceLoader:
                 return None
             
             logger.info(f"✅ Loaded from disk cache: {cache_file.name}")
+            self.scanned_at = cache_data.get("scanned_at") or cache_data.get("cached_at")
             return cache_data.get("resources", {})
             
         except Exception as e:
@@ -538,11 +910,14 @@ class DirectFileResourceLoader:
             cache_data = {
                 "commit_hashes": commit_hashes,
                 "cached_at": datetime.utcnow().isoformat() + "Z",
+                "scanned_at": self.scanned_at,
                 "resources": resources
             }
             
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            # orjson + gzip: the cache holds every file's content, so compact
+            # encoding matters for both disk size and cold-start load time
+            with gzip.open(cache_file, 'wb', compresslevel=6) as f:
+                f.write(orjson.dumps(cache_data))
             
             logger.info(f"💾 Saved to disk cache: {cache_file.name}")
             
@@ -555,7 +930,8 @@ class DirectFileResourceLoader:
     def _cleanup_old_caches(self, current_cache: Path) -> None:
         """Remove old cache files, keeping only the current one."""
         try:
-            for cache_file in self.cache_dir.glob("resource-cache-*.json"):
+            # Also matches the uncompressed .json caches of older versions
+            for cache_file in self.cache_dir.glob("resource-cache-*.json*"):
                 if cache_file != current_cache:
                     cache_file.unlink()
                     logger.debug(f"Removed old cache file: {cache_file.name}")
@@ -570,6 +946,7 @@ class DirectFileResourceLoader:
         try:
             self.observer = Observer()
             event_handler = CanonicalRepoFileHandler(self)
+            self._event_handler = event_handler
             
             # Watch all canonical repositories
             for repo_name, repo_path in self.repos.items():
@@ -590,6 +967,9 @@ class DirectFileResourceLoader:
             self.observer.stop()
             self.observer.join()
             self.observer = None
+            if self._event_handler is not None:
+                self._event_handler.cancel()
+                self._event_handler = None
             logger.info("Stopped hot-reload watcher")
     
     def _check_and_reload_on_commit_change(self) -> None:
@@ -609,11 +989,9 @@ class DirectFileResourceLoader:
             logger.info(f"📦 Commit hashes changed: {', '.join(changed_repos)}")
             logger.info("🔄 Reloading canonical resources...")
             
-            # Clear caches and rescan
-            self._cached_resources = {}
+            # Rescan repositories (will save new cache). force_refresh bypasses
+            # the in-memory cache, whose resources are reused for unchanged files
             self._cache_timestamp = None
-            
-            # Rescan repositories (will save new cache)
             self.scan_repositories(force_refresh=True)
             
             logger.info("✅ Resources reloaded after git pull")
@@ -693,14 +1071,19 @@ class DirectFileResourceLoader:
                 return
             
             # Get all resources as flat list
-            all_resources = []
-            for resource_list in resources.values():
-                all_resources.extend(resource_list)
+            all_resources = list(chain.from_iterable(resources.values()))
+            
+            def run_enrichment():
+                try:
+                    enrichment_engine.enrich_resources(all_resources, commit_hashes, force_all=False)
+                except Exception as e:
+                    logger.warning(f"LLM enrichment failed: {e}")
             
-            # Trigger enrichment in background (non-blocking)
+            # Trigger enrichment in background (non-blocking) so the LLM
+            # round-trips don't hold up the scan that triggered them.
             # Only enrich new files (not force_all)
             logger.info("Triggering LLM enrichment for new/changed files...")
-            enrichment_engine.enrich_resources(all_resources, commit_hashes, force_all=False)
+            threading.Thread(target=run_enrichment, name="llm-enrichment", daemon=True).start()
             
         except Exception as e:
             logger.warning(f"Failed to trigger enrichment: {e}")
@@ -712,10 +1095,5 @@ class DirectFileResourceLoader:
         Returns:
             List of all resource dictionaries
         """
-        all_resources = []
         structured_resources = self.scan_repositories()
-        
-        for resource_type, resources in structured_resources.items():
-            all_resources.extend(resources)
-        
-        return all_resources
+        return list(chain.from_iterable(structured_resources.values()))
@@ -25,6 +25,31 @@ from .types import (
 logger = logging.getLogger(__name__)
 
 
+def _keyword_pattern(*keywords: str) -> "re.Pattern[str]":
+    """Compile keywords into one case-insensitive substring alternation"""
+    return re.compile("|".join(re.escape(kw) for kw in keywords), re.IGNORECASE)
+
+
+# Error categorization keywords (checked in this order)
+_AUTH_ERROR_RE = _keyword_pattern(
+    "authorization",
+    "signatory",
+    "observer",
+    "controller",
+    "maintainer",
+    "authority",
+)
+_TYPE_ERROR_RE = _keyword_pattern(
+    "type",
+    "couldn't match",
+    "expected type",
+    "actual type",
+    "no instance",
+    "ambiguous",
+)
+_SYNTAX_ERROR_RE = _keyword_pattern("parse error", "unexpected", "lexical error")
+
+
 class DamlCompilerError(Exception):
     """Raised when DAML compiler integration encounters a system error"""
 
@@ -411,35 +436,14 @@ dependencies:
         Returns:
             ErrorCategory enum value
         """
-        error_lower = error_msg.lower()
-
-        # Authorization errors
-        auth_keywords = [
-            "authorization",
-            "signatory",
-            "observer",
-            "controller",
-            "maintainer",
-            "authority",
-        ]
-        if any(kw in error_lower for kw in auth_keywords):
+        # Single case-insensitive scan per category, no lowercased copy
+        if _AUTH_ERROR_RE.search(error_msg):
             return ErrorCategory.AUTHORIZATION
 
-        # Type errors
-        type_keywords = [
-            "type",
-            "couldn't match",
-            "expected type",
-            "actual type",
-            "no instance",
-            "ambiguous",
-        ]
-        if any(kw in error_lower for kw in type_keywords):
+        if _TYPE_ERROR_RE.search(error_msg):
             return ErrorCategory.TYPE_SAFETY
 
-        # Syntax errors
-        syntax_keywords = ["parse error", "unexpected", "lexical error"]
-        if any(kw in error_lower for kw in syntax_keywords):
+        if _SYNTAX_ERROR_RE.search(error_msg):
             return ErrorCategory.SYNTAX
 
         # Default to OTHER
@@ -9,10 +9,31 @@ import os
 import sys
 from pathlib import Path
 
-from dotenv import dotenv_values, load_dotenv
+from dotenv import dotenv_values
 
 ENV_VALUES = {}
 
+
+def _load_env_file(path: Path) -> dict:
+    """
+    Parse an env file once and export its values to os.environ.
+
+    Equivalent to load_dotenv() followed by dotenv_values(), but parses the
+    file a single time. Existing environment variables take precedence.
+
+    Args:
+        path: Path to the env file
+
+    Returns:
+        Parsed key/value pairs from the file
+    """
+    values = dotenv_values(path)
+    for key, value in values.items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+    return values
+
+
 # Check if running in an isolated environment (e.g., AWS ECS, Kubernetes, etc.)
 # where .env.canton file is not available
 is_isolated_environment = (
@@ -27,14 +48,12 @@ if not is_isolated_environment:
     env_canton_path = Path(__file__).parent.parent.parent / ".env.canton"
 
     if env_canton_path.exists():
-        load_dotenv(env_canton_path)
-        ENV_VALUES = dotenv_values(env_canton_path)
+        ENV_VALUES = _load_env_file(env_canton_path)
     else:
         # Try to find .env.canton in current working directory
         cwd_env_path = Path.cwd() / ".env.canton"
         if cwd_env_path.exists():
-            load_dotenv(cwd_env_path)
-            ENV_VALUES = dotenv_values(cwd_env_path)
+            ENV_VALUES = _load_env_file(cwd_env_path)
         else:
             print(
                 "WARNING: .env.canton file not found. "
@@ -95,6 +114,8 @@ ENV_VALUES["DCAP_DEFAULT_CALLER"] = os.getenv("DCAP_DEFAULT_CALLER", "unknown-cl
 ENV_VALUES["DCAP_DEFAULT_PAYER"] = os.getenv("DCAP_DEFAULT_PAYER", "0x0000000000000000000000000000000000000000")
 ENV_VALUES["DCAP_SERVER_URL"] = os.getenv("DCAP_SERVER_URL", "")
 ENV_VALUES["DCAP_DISCOVER_INTERVAL_SEC"] = os.getenv("DCAP_DISCOVER_INTERVAL_SEC", "300")
+# Coalesce perf_update messages into perf_batch datagrams (receiver must support it)
+ENV_VALUES["DCAP_BATCH"] = os.getenv("DCAP_BATCH", "false")
 
 # Semantic Search Configuration
 ENV_VALUES["CANONICAL_DOCS_PATH"] = os.getenv("CANONICAL_DOCS_PATH", "../../canonical-daml-docs")
@@ -144,6 +165,9 @@ ENV_VALUES["CANTON_DEFAULT_PAYER_PARTY"] = os.getenv("CANTON_DEFAULT_PAYER_PARTY
 # Featured App Rewards (FeaturedAppActivityMarker emission per CIP-0047)
 ENV_VALUES["FEATURED_APP_REWARDS_ENABLED"] = os.getenv("FEATURED_APP_REWARDS_ENABLED", "false")
 
+# Canton sandbox environments (Docker)
+ENV_VALUES["CANTON_DOCKER_MAX_POOL_SIZE"] = os.getenv("CANTON_DOCKER_MAX_POOL_SIZE", "32")
+
 # Isolated environment flag (also read directly via os.environ at module level)
 ENV_VALUES["IS_ISOLATED_ENVIRONMENT"] = os.getenv("IS_ISOLATED_ENVIRONMENT", "false")
 
@@ -7,11 +7,12 @@ Handles MCP resource protocol methods with Git verification:
 """
 
 import logging
-import json
 import os
 from typing import Any, Dict, Optional
 from pathlib import Path
 
+import orjson
+
 from ..core.types.mcp import (
     ListResourcesResult,
     ReadResourceResult,
@@ -70,12 +71,13 @@ def handle_resources_list() -> ListResourcesResult:
             # Add direct file metadata
             mcp_resource._meta = {
                 "canonical_hash": resource.get("canonical_hash"),
+                "content_hash": resource.get("content_hash"),
                 "source_commit": resource.get("source_commit"),
                 "source_file": resource.get("source_file"),
                 "source_repo": resource.get("source_repo"),
                 "file_path": resource.get("file_path"),
                 "file_extension": resource.get("file_extension"),
-                "extracted_at": resource.get("extracted_at"),
+                "extracted_at": resource.get("extracted_at") or loader.scanned_at,
                 "resource_type": resource_type,
                 "direct_file": True
             }
@@ -123,7 +125,7 @@ def handle_resources_read(uri: str) -> ReadResourceResult:
         raise ValueError(f"Direct file resource not found: {uri}")
     
     # Serialize resource content as JSON
-    content_text = json.dumps(resource, indent=2)
+    content_text = orjson.dumps(resource, option=orjson.OPT_INDENT_2).decode()
     
     # Create resource contents with Git verification metadata
     resource_contents = TextResourceContents(
@@ -0,0 +1,3 @@
+"""
+Tests for the core MCP server framework
+"""
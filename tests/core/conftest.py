@@ -0,0 +1,22 @@
+"""
+Shared fixtures for core tests
+"""
+
+import os
+
+import pytest
+
+
+@pytest.fixture
+def fake_daml(tmp_path, monkeypatch):
+    """Install a fake `daml` executable first on PATH, given its shell script body"""
+
+    def install(script):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        daml = bin_dir / "daml"
+        daml.write_text("#!/bin/sh\n" + script)
+        daml.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    return install
@@ -0,0 +1,94 @@
+"""
+Tests for Tool base class
+
+Unit tests for MCP input/output schema generation.
+"""
+
+from typing import List
+
+from pydantic import BaseModel
+
+from canton_mcp_server.core.base import Tool
+
+
+class Item(BaseModel):
+    name: str
+    count: int
+
+
+class Params(BaseModel):
+    query: str
+
+
+class Result(BaseModel):
+    items: List[Item]
+    best: Item
+
+
+class SchemaTool(Tool[Params, Result]):
+    name = "schema_tool"
+    description = "Tool used for schema tests"
+    params_model = Params
+    result_model = Result
+
+    async def execute(self, ctx):
+        yield None
+
+
+class NoResultTool(Tool[Params, dict]):
+    name = "no_result_tool"
+    description = "Tool without a result model"
+    params_model = Params
+
+    async def execute(self, ctx):
+        yield None
+
+
+class TestToolSchemas:
+    """Test tool schema generation"""
+
+    def test_output_schema_inlines_refs(self):
+        """Test that $defs and $ref are removed from the output schema"""
+        schema = SchemaTool().get_output_schema()
+
+        assert "$defs" not in schema
+        assert "$ref" not in str(schema)
+        assert schema["properties"]["best"]["properties"]["count"]["type"] == "integer"
+        assert schema["properties"]["items"]["items"]["properties"]["name"]["type"] == "string"
+
+    def test_output_schema_none_without_result_model(self):
+        """Test that tools without result_model have no output schema"""
+        assert NoResultTool().get_output_schema() is None
+
+    def test_schemas_cached_per_class(self):
+        """Test that schemas are computed once and shared across instances"""
+        first, second = SchemaTool(), SchemaTool()
+
+        assert first.get_output_schema() is second.get_output_schema()
+        assert first.get_input_schema() is second.get_input_schema()
+        assert NoResultTool().get_input_schema() == first.get_input_schema()
+
+    def test_input_schema_shared_by_model(self):
+        """Test that tools with the same params model share one schema"""
+        assert NoResultTool().get_input_schema() is SchemaTool().get_input_schema()
+
+    def test_inline_schema_refs_does_not_mutate_input(self):
+        """Test that inlining copies definitions instead of sharing them"""
+        schema = Result.model_json_schema()
+        original = Result.model_json_schema()
+
+        inlined = Tool._inline_schema_refs(schema)
+
+        assert schema == original
+        best = inlined["properties"]["best"]
+        item = inlined["properties"]["items"]["items"]
+        assert best == item
+        assert best is not item
+        assert best is not schema["$defs"]["Item"]
+
+    def test_inline_schema_refs_fast_path_without_defs(self):
+        """Test that schemas without $defs are returned without copying"""
+        schema = Item.model_json_schema()
+
+        assert "$defs" not in schema
+        assert Tool._inline_schema_refs(schema) is schema
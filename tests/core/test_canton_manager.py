@@ -0,0 +1,352 @@
+"""
+Tests for Canton Manager
+
+Unit tests for Canton environment status tracking, using stand-in
+containers so no Docker daemon is needed.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+
+from canton_mcp_server.core.canton_manager import CantonEnvironment, CantonManager, _LogWatcher
+
+
+class FakeContainer:
+    """Minimal stand-in for docker.models.containers.Container"""
+
+    def __init__(self, status="running"):
+        self.status = status
+        self.attrs = {"State": {"ExitCode": 0}}
+        self.reloads = 0
+
+    def reload(self):
+        self.reloads += 1
+
+    def stop(self, timeout=None):
+        self.status = "exited"
+
+    def kill(self):
+        self.status = "killed"
+
+    def remove(self, force=False):
+        self.status = "removed"
+
+
+class FakeLogStream:
+    """Stand-in for a followed docker log stream that blocks until closed"""
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.started = threading.Event()
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        yield from self.lines
+        self.started.set()
+        self.closed.wait(timeout=5)
+
+    def close(self):
+        self.closed.set()
+
+
+class TestContainerStatus:
+    """Test cached container status lookups"""
+
+    def test_status_reused_within_ttl(self):
+        """Test that repeated lookups within the TTL hit Docker once"""
+        container = FakeContainer()
+        env = CantonEnvironment(env_id="test", container=container)
+
+        assert env._refresh_status() == "running"
+        assert env._refresh_status() == "running"
+        assert container.reloads == 1
+
+    def test_status_reloaded_after_ttl(self):
+        """Test that an expired status is reloaded from Docker"""
+        container = FakeContainer()
+        env = CantonEnvironment(env_id="test", container=container)
+
+        env._refresh_status()
+        container.status = "exited"
+        assert env._refresh_status(ttl=0) == "exited"
+        assert container.reloads == 2
+
+    def test_no_container(self):
+        """Test that environments without a container report no status"""
+        env = CantonEnvironment(env_id="test")
+
+        assert env._refresh_status() is None
+        assert env.is_healthy() is False
+
+
+class TestHealthCheck:
+    """Test the ledger API port probe"""
+
+    def test_async_probe_detects_listening_port(self):
+        """Test that a listening ledger port reports healthy"""
+
+        async def probe():
+            server = await asyncio.start_server(lambda r, w: w.close(), "localhost", 0)
+            port = server.sockets[0].getsockname()[1]
+            env = CantonEnvironment(
+                env_id="test",
+                container=FakeContainer(),
+                ledger_port=port,
+                started_at_monotonic=time.monotonic() - 10,
+            )
+            async with server:
+                return await env.is_healthy_async()
+
+        assert asyncio.run(probe()) is True
+
+    def test_async_probe_waits_for_connection_close(self, monkeypatch):
+        """Test that the probe connection is fully closed before returning"""
+        events = []
+
+        class FakeWriter:
+            def close(self):
+                events.append("close")
+
+            async def wait_closed(self):
+                events.append("wait_closed")
+                raise ConnectionResetError
+
+        async def fake_open_connection(host, port):
+            return None, FakeWriter()
+
+        monkeypatch.setattr(asyncio, "open_connection", fake_open_connection)
+        env = CantonEnvironment(
+            env_id="test", container=FakeContainer(), started_at_monotonic=time.monotonic() - 10
+        )
+
+        assert asyncio.run(env.is_healthy_async()) is True
+        assert events == ["close", "wait_closed"]
+
+    def test_async_probe_reloads_container_off_loop(self):
+        """Test that the container status refresh doesn't run on the event loop thread"""
+        container = FakeContainer("exited")
+        threads = []
+        container.reload = lambda: threads.append(threading.get_ident())
+        env = CantonEnvironment(
+            env_id="test", container=container, started_at_monotonic=time.monotonic() - 10
+        )
+
+        assert asyncio.run(env.is_healthy_async()) is False
+        assert threads and threading.get_ident() not in threads
+
+    def test_async_probe_waits_for_grace_period(self):
+        """Test that a freshly started container is not probed yet"""
+        env = CantonEnvironment(env_id="test", container=FakeContainer())
+
+        assert asyncio.run(env.is_healthy_async()) is False
+
+
+class TestListEnvironments:
+    """Test listing environments"""
+
+    def test_list_environments_returns_status_per_env(self):
+        """Test that every tracked environment is reported in order"""
+        manager = CantonManager.__new__(CantonManager)
+        manager.environments = {
+            env_id: CantonEnvironment(env_id=env_id, container=FakeContainer("exited"))
+            for env_id in ("a", "b")
+        }
+
+        statuses = asyncio.run(manager.list_environments())
+
+        assert [s["env_id"] for s in statuses] == ["a", "b"]
+        assert all(s["container_status"] == "exited" and not s["healthy"] for s in statuses)
+
+    def test_get_status_reloads_container_once(self, monkeypatch):
+        """Test that get_status doesn't repeat the container check"""
+        manager = CantonManager.__new__(CantonManager)
+        container = FakeContainer("exited")
+        env = CantonEnvironment(env_id="a", container=container)
+        manager.environments = {"a": env}
+
+        def fail(self):
+            raise AssertionError("port should not be probed for a stopped container")
+
+        monkeypatch.setattr(CantonEnvironment, "_check_ledger_port", fail)
+
+        assert manager.get_status("a")["healthy"] is False
+        assert container.reloads == 1
+
+
+class TestWaitForReady:
+    """Test readiness polling"""
+
+    def test_ready_detected_during_start_period(self, monkeypatch):
+        """Test that polling is fast during the start period"""
+        manager = CantonManager.__new__(CantonManager)
+        env = CantonEnvironment(env_id="test", container=FakeContainer())
+        results = iter([False, False, True])
+
+        async def fake_is_healthy(self):
+            return next(results)
+
+        monkeypatch.setattr(CantonEnvironment, "is_healthy_async", fake_is_healthy)
+
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        assert asyncio.run(manager.wait_for_ready(env, poll_interval=2, start_interval=0.25))
+        assert sleeps == [0.25, 0.25]
+
+    def test_exited_container_fails_fast(self):
+        """Test that an exited container stops the wait immediately"""
+        manager = CantonManager.__new__(CantonManager)
+        env = CantonEnvironment(env_id="test", container=FakeContainer("exited"))
+
+        assert asyncio.run(manager.wait_for_ready(env, timeout=5)) is False
+
+    def test_fatal_log_line_aborts_wait(self):
+        """Test that a fatal start-up log line stops the wait early"""
+        manager = CantonManager.__new__(CantonManager)
+        container = FakeContainer()
+        container.name = "canton-test"
+        container.logs = lambda **kwargs: iter(
+            [b"Starting Canton\n", b"java.net.BindException: Address already in use\n"]
+        )
+        env = CantonEnvironment(env_id="test", container=container)
+
+        async def wait():
+            fatal_event, watcher = manager._start_log_watcher(container)
+            try:
+                return await manager.wait_for_ready(
+                    env, timeout=30, poll_interval=30, start_period=0, fatal_event=fatal_event
+                )
+            finally:
+                watcher.stop()
+
+        assert asyncio.run(asyncio.wait_for(wait(), timeout=5)) is False
+
+    def test_fatal_pattern_matched_across_chunks(self):
+        """Test that a fatal line split across log chunks is reported as one line"""
+        container = FakeContainer()
+        container.name = "canton-test"
+        container.logs = lambda **kwargs: iter(
+            [
+                b"Unable to start sequencer, retrying\nConfigException: using default\n",
+                b"Starting\nERROR java.net.Bind",
+                b"Exception: Address already in use\nnext line\n",
+            ]
+        )
+        reported = []
+        watcher = _LogWatcher(container, reported.append)
+
+        watcher.start()
+        watcher._thread.join(timeout=5)
+
+        assert reported == ["ERROR java.net.BindException: Address already in use"]
+
+    def test_log_watcher_stopped_after_wait(self):
+        """Test that stopping the watcher closes the log stream and ends its thread"""
+        manager = CantonManager.__new__(CantonManager)
+        container = FakeContainer()
+        container.name = "canton-test"
+        stream = FakeLogStream([b"Starting Canton\n"])
+        container.logs = lambda **kwargs: stream
+
+        async def watch():
+            _, watcher = manager._start_log_watcher(container)
+            assert stream.started.wait(timeout=5)
+            watcher.stop()
+            return watcher
+
+        watcher = asyncio.run(watch())
+        watcher._thread.join(timeout=5)
+
+        assert stream.closed.is_set()
+        assert not watcher._thread.is_alive()
+
+
+class FakeImages:
+    """Stand-in for the docker client's image collection"""
+
+    def __init__(self):
+        self.gets = 0
+
+    def get(self, name):
+        self.gets += 1
+
+
+class TestImageCache:
+    """Test Canton image lookups"""
+
+    def test_prewarmed_image_not_looked_up_again(self):
+        """Test that a prewarmed image skips the daemon lookup on spin-up"""
+        manager = CantonManager.__new__(CantonManager)
+        manager.docker_client = type("Client", (), {"images": FakeImages()})()
+        manager._image_cache = set()
+
+        asyncio.run(manager.prewarm("canton:test"))
+        manager._ensure_image("canton:test")
+
+        assert manager.docker_client.images.gets == 1
+
+
+class TestConfigDirCache:
+    """Test sandbox config directory reuse"""
+
+    def test_config_dir_reused_per_ports_and_removed_on_teardown_all(self):
+        """Test that configs are rendered once per port pair"""
+        manager = CantonManager.__new__(CantonManager)
+        manager.environments = {}
+        manager._config_dir_cache = {}
+
+        first = manager._get_config_dir(6865, 7575)
+        assert manager._get_config_dir(6865, 7575) == first
+        assert manager._get_config_dir(6866, 7576) != first
+        assert "ledger-api.port = 6865" in (first / "sandbox.conf").read_text()
+
+        asyncio.run(manager.teardown_all())
+        assert not first.exists()
+        assert manager._config_dir_cache == {}
+
+
+class TestTeardown:
+    """Test environment teardown"""
+
+    def test_teardown_all_kills_every_environment(self):
+        """Test that teardown_all removes all environments without a grace period"""
+        manager = CantonManager.__new__(CantonManager)
+        manager._config_dir_cache = {}
+        containers = [FakeContainer(), FakeContainer()]
+        manager.environments = {
+            f"env-{i}": CantonEnvironment(env_id=f"env-{i}", container=c)
+            for i, c in enumerate(containers)
+        }
+        killed = []
+        for c in containers:
+            c.kill = lambda c=c: killed.append(c)
+
+        asyncio.run(manager.teardown_all())
+
+        assert manager.environments == {}
+        assert len(killed) == 2
+        assert all(c.status == "removed" for c in containers)
+
+
+class TestPortCheck:
+    """Test the pre-flight port check"""
+
+    def test_spin_up_fails_fast_on_busy_port(self):
+        """Test that a bound ledger port is reported before touching Docker"""
+        manager = CantonManager.__new__(CantonManager)
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("0.0.0.0", 0))
+            sock.listen()
+            port = sock.getsockname()[1]
+
+            with pytest.raises(RuntimeError, match=str(port)):
+                asyncio.run(manager.spin_up_docker(ledger_port=port))
@@ -0,0 +1,67 @@
+"""
+Tests for ToolContext
+
+Unit tests for the response helpers tools yield from execute().
+"""
+
+import json
+import logging
+
+from pydantic import BaseModel, Field
+
+from canton_mcp_server.core.context import ToolContext
+
+
+class Result(BaseModel):
+    item_count: int = Field(alias="itemCount")
+    status: str
+
+
+def make_context():
+    """Build a context without a real request (helpers only need the ID)"""
+    ctx = ToolContext.__new__(ToolContext)
+    ctx._request_id = 7
+    ctx._progress_token = None
+    ctx._warned_no_progress_token = False
+    return ctx
+
+
+class TestStructured:
+    """Test structured responses"""
+
+    def test_model_result_serialized_by_alias(self):
+        """Test that model results use aliases in both data and text"""
+        response = make_context().structured(Result(itemCount=3, status="done"))
+
+        result = response.result
+        assert response.id == 7
+        assert result.structured_content == {"itemCount": 3, "status": "done"}
+        assert json.loads(result.content[0].text) == result.structured_content
+
+    def test_model_text_keeps_json_dumps_format(self):
+        """Test that the text content is the indented, ASCII-escaped json.dumps output"""
+        response = make_context().structured(Result(itemCount=1, status="prêt ✓"))
+
+        text = response.result.content[0].text
+        assert text == json.dumps({"itemCount": 1, "status": "prêt ✓"}, indent=2)
+        assert "\\u00ea" in text
+
+    def test_dict_result_passed_through(self):
+        """Test that dict results are used as-is"""
+        response = make_context().structured({"a": 1}, summary_text="one")
+
+        assert response.result.structured_content == {"a": 1}
+        assert response.result.content[0].text == "one"
+
+
+class TestProgress:
+    """Test progress notifications"""
+
+    def test_missing_progress_token_warns_once(self, caplog):
+        """Test that progress without a token is dropped with a single warning"""
+        ctx = make_context()
+
+        with caplog.at_level(logging.WARNING, logger="canton_mcp_server.core.context"):
+            assert all(ctx.progress(i, 10) is None for i in range(10))
+
+        assert len(caplog.records) == 1
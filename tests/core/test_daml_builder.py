@@ -0,0 +1,202 @@
+"""
+Tests for DAML Builder
+
+Unit tests for daml.yaml parsing.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from canton_mcp_server.core import daml_builder
+from canton_mcp_server.core.daml_builder import DAMLBuilder
+
+
+def write_daml_yaml(project, name="demo", version="1.0.0"):
+    (project / "daml.yaml").write_text(
+        f"sdk-version: 2.9.0\nname: {name}\nversion: {version}\nsource: daml\n"
+    )
+
+
+class TestParseDamlYaml:
+    """Test daml.yaml parsing"""
+
+    def test_parses_required_fields(self, tmp_path):
+        """Test that name, version and SDK version are extracted"""
+        write_daml_yaml(tmp_path)
+
+        project = DAMLBuilder.parse_daml_yaml(tmp_path)
+
+        assert (project.name, project.version, project.sdk_version) == ("demo", "1.0.0", "2.9.0")
+        assert project.source_path == tmp_path.resolve()
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a directory without daml.yaml is rejected"""
+        with pytest.raises(FileNotFoundError):
+            DAMLBuilder.parse_daml_yaml(tmp_path)
+
+    def test_unchanged_file_not_reparsed(self, tmp_path, monkeypatch):
+        """Test that an unchanged daml.yaml is served from the cache"""
+        write_daml_yaml(tmp_path)
+        first = DAMLBuilder.parse_daml_yaml(tmp_path)
+        first.dar_path = tmp_path / "x.dar"
+
+        def fail(*args, **kwargs):
+            raise AssertionError("daml.yaml should not be parsed again")
+
+        monkeypatch.setattr(daml_builder.yaml, "load", fail)
+        second = DAMLBuilder.parse_daml_yaml(tmp_path)
+
+        assert second == DAMLBuilder.parse_daml_yaml(tmp_path)
+        assert second.name == "demo" and second.dar_path is None
+
+    def test_changed_file_reparsed(self, tmp_path):
+        """Test that edits to daml.yaml invalidate the cache"""
+        write_daml_yaml(tmp_path)
+        DAMLBuilder.parse_daml_yaml(tmp_path)
+
+        write_daml_yaml(tmp_path, version="2.0.0")
+        st = (tmp_path / "daml.yaml").stat()
+        os.utime(tmp_path / "daml.yaml", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert DAMLBuilder.parse_daml_yaml(tmp_path).version == "2.0.0"
+
+
+class TestBuild:
+    """Test running daml build"""
+
+    def test_build_locates_dar(self, tmp_path, fake_daml):
+        """Test that a successful build returns the project with its DAR"""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        write_daml_yaml(project_dir)
+        fake_daml("mkdir -p .daml/dist && echo dar > .daml/dist/demo-1.0.0.dar\n")
+
+        project = asyncio.run(DAMLBuilder().build(project_dir))
+
+        assert project.dar_path == project_dir.resolve() / ".daml" / "dist" / "demo-1.0.0.dar"
+
+    def test_build_failure_reports_stderr(self, tmp_path, fake_daml):
+        """Test that a failing build raises with the compiler output"""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        write_daml_yaml(project_dir)
+        fake_daml("echo 'type error' >&2\nexit 1\n")
+
+        with pytest.raises(RuntimeError, match="type error"):
+            asyncio.run(DAMLBuilder().build(project_dir))
+
+    def test_cancelled_build_kills_compiler(self, tmp_path, fake_daml):
+        """Test that daml build is killed and reaped when the caller is cancelled"""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        write_daml_yaml(project_dir)
+        pid_file = tmp_path / "pid"
+        fake_daml(f"echo $$ > {pid_file}\nexec sleep 30\n")
+
+        async def cancel_build():
+            task = asyncio.create_task(DAMLBuilder().build(project_dir))
+            while not pid_file.exists() or not pid_file.read_text().strip():
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(asyncio.wait_for(cancel_build(), timeout=10))
+
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
+
+    def test_up_to_date_dar_skips_build(self, tmp_path, fake_daml):
+        """Test that the compiler only runs when sources are newer than the DAR"""
+        project_dir = tmp_path / "project"
+        (project_dir / "daml").mkdir(parents=True)
+        write_daml_yaml(project_dir)
+        source = project_dir / "daml" / "Main.daml"
+        source.write_text("module Main where\n")
+        builds = tmp_path / "builds"
+        fake_daml(
+            f"echo build >> {builds}\n"
+            "mkdir -p .daml/dist && echo dar > .daml/dist/demo-1.0.0.dar\n"
+        )
+
+        asyncio.run(DAMLBuilder().build(project_dir))
+        project = asyncio.run(DAMLBuilder().build(project_dir))
+        assert project.dar_path is not None
+        assert builds.read_text().count("build") == 1
+
+        dar_mtime = (project_dir / ".daml" / "dist" / "demo-1.0.0.dar").stat().st_mtime_ns
+        os.utime(source, ns=(dar_mtime + 10**9, dar_mtime + 10**9))
+        asyncio.run(DAMLBuilder().build(project_dir))
+        assert builds.read_text().count("build") == 2
+
+    def _install_counting_build(self, tmp_path, fake_daml):
+        builds = tmp_path / "builds"
+        fake_daml(
+            f"echo build >> {builds}\n"
+            "mkdir -p .daml/dist && echo dar > .daml/dist/demo-1.0.0.dar\n"
+        )
+        return builds
+
+    def _backdate(self, project_dir):
+        """Age every build input, leaving the DAR newer than all of them"""
+        for root, dirs, files in os.walk(project_dir):
+            for name in dirs + files:
+                path = os.path.join(root, name)
+                os.utime(path, (0, 1_000), follow_symlinks=False)
+        os.utime(project_dir, (0, 1_000))
+        os.utime(project_dir / ".daml" / "dist" / "demo-1.0.0.dar", (0, 2_000))
+
+    def test_deleted_source_triggers_build(self, tmp_path, fake_daml):
+        """Test that removing or renaming a module makes the DAR stale"""
+        project_dir = tmp_path / "project"
+        (project_dir / "daml").mkdir(parents=True)
+        write_daml_yaml(project_dir)
+        (project_dir / "daml" / "Main.daml").write_text("module Main where\n")
+        (project_dir / "daml" / "Extra.daml").write_text("module Extra where\n")
+        builds = self._install_counting_build(tmp_path, fake_daml)
+
+        asyncio.run(DAMLBuilder().build(project_dir))
+        self._backdate(project_dir)
+        asyncio.run(DAMLBuilder().build(project_dir))
+        assert builds.read_text().count("build") == 1
+
+        (project_dir / "daml" / "Extra.daml").unlink()
+        asyncio.run(DAMLBuilder().build(project_dir))
+        assert builds.read_text().count("build") == 2
+
+        self._backdate(project_dir)
+        (project_dir / "daml" / "Main.daml").rename(project_dir / "daml" / "Renamed.daml")
+        asyncio.run(DAMLBuilder().build(project_dir))
+        assert builds.read_text().count("build") == 3
+
+    def test_dependency_dar_change_triggers_build(self, tmp_path, fake_daml):
+        """Test that newer or missing data-dependencies make the DAR stale"""
+        project_dir = tmp_path / "project"
+        (project_dir / "daml").mkdir(parents=True)
+        (project_dir / "daml.yaml").write_text(
+            "sdk-version: 2.9.0\nname: demo\nversion: 1.0.0\nsource: daml\n"
+            "dependencies:\n- daml-prim\n- daml-stdlib\n"
+            "data-dependencies:\n- deps/lib.dar\n"
+        )
+        (project_dir / "deps").mkdir()
+        (project_dir / "deps" / "lib.dar").write_text("lib\n")
+        builds = self._install_counting_build(tmp_path, fake_daml)
+
+        project = asyncio.run(DAMLBuilder().build(project_dir))
+        assert project.dependency_paths == (project_dir.resolve() / "deps" / "lib.dar",)
+        self._backdate(project_dir)
+        asyncio.run(DAMLBuilder().build(project_dir))
+        assert builds.read_text().count("build") == 1
+
+        os.utime(project_dir / "deps" / "lib.dar", (0, 3_000))
+        asyncio.run(DAMLBuilder().build(project_dir))
+        assert builds.read_text().count("build") == 2
+
+        self._backdate(project_dir)
+        (project_dir / "deps" / "lib.dar").unlink()
+        os.utime(project_dir / "deps", (0, 1_000))
+        asyncio.run(DAMLBuilder().build(project_dir))
+        assert builds.read_text().count("build") == 3
+
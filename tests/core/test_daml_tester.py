@@ -0,0 +1,123 @@
+"""
+Tests for DAML Tester
+
+Unit tests for parsing `daml test` output.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from canton_mcp_server.core import daml_tester
+from canton_mcp_server.core.daml_tester import DAMLTester
+
+PASSING_OUTPUT = """\
+test_create ok
+test_transfer ok
+"""
+
+FAILING_OUTPUT = """\
+✓ test_create
+✗ test_transfer: assertion failed
+Script failed: missing authorization
+"""
+
+
+class TestParseTestOutput:
+    """Test parsing of test runner output"""
+
+    def test_counts_passing_tests(self):
+        """Test that ok lines are counted as passed"""
+        result = DAMLTester()._parse_test_output(PASSING_OUTPUT, "", 0, 1.5)
+
+        assert result.success
+        assert (result.tests_run, result.tests_passed, result.tests_failed) == (2, 2, 0)
+        assert result.failures == []
+
+    def test_collects_failures(self):
+        """Test that failed tests and failure messages are reported"""
+        result = DAMLTester()._parse_test_output(FAILING_OUTPUT, "", 1, 2.0)
+
+        assert not result.success
+        assert (result.tests_passed, result.tests_failed) == (1, 1)
+        assert result.failures == ["test_transfer: assertion failed", "missing authorization"]
+
+    def test_failures_deduplicated_after_strip(self):
+        """Test that repeated failure messages are reported once, in order"""
+        output = "FAIL test_b  \nFAIL test_a\nFAIL test_b\n"
+
+        result = DAMLTester()._parse_test_output(output, "", 1, 1.0)
+
+        assert result.failures == ["test_b", "test_a"]
+
+    def test_no_tests(self):
+        """Test that an empty test run with exit code 0 succeeds"""
+        result = DAMLTester()._parse_test_output("", "No tests to run\n", 0, 0.1)
+
+        assert result.success and result.tests_run == 0
+
+    def test_stderr_lines_parsed(self):
+        """Test that failures reported on stderr are counted and kept in output"""
+        result = DAMLTester()._parse_test_output("✓ test_create\n", "FAIL test_transfer\n", 1, 1.0)
+
+        assert (result.tests_passed, result.tests_failed) == (1, 1)
+        assert result.failures == ["test_transfer"]
+        assert result.output == "✓ test_create\nFAIL test_transfer\n"
+
+
+class TestRunTests:
+    """Test running daml test"""
+
+    def test_runs_daml_test(self, tmp_path, fake_daml):
+        """Test that daml test output is captured and parsed"""
+        (tmp_path / "daml.yaml").write_text("name: demo\n")
+        fake_daml("echo 'test_create ok'\necho 'test_transfer ok'\n")
+
+        result = asyncio.run(DAMLTester().run_tests(tmp_path))
+
+        assert result.success
+        assert result.tests_passed == 2
+
+    def test_missing_daml_yaml_raises(self, tmp_path):
+        """Test that a directory without daml.yaml is rejected"""
+        with pytest.raises(FileNotFoundError, match="daml.yaml not found"):
+            asyncio.run(DAMLTester().run_tests(tmp_path))
+
+    def test_stderr_streamed_with_stdout(self, tmp_path, fake_daml):
+        """Test that failures written to stderr are parsed from the merged stream"""
+        (tmp_path / "daml.yaml").write_text("name: demo\n")
+        fake_daml("echo 'test_create ok'\necho 'FAIL test_transfer' >&2\nexit 1\n")
+
+        result = asyncio.run(DAMLTester().run_tests(tmp_path))
+
+        assert not result.success
+        assert (result.tests_passed, result.tests_failed) == (1, 1)
+        assert result.failures == ["test_transfer"]
+        assert "FAIL test_transfer" in result.output
+
+    def test_long_line_skipped(self, tmp_path, fake_daml):
+        """Test that a line over the stream limit doesn't abort the run"""
+        (tmp_path / "daml.yaml").write_text("name: demo\n")
+        fake_daml("head -c 3000000 /dev/zero | tr '\\0' x\necho\necho 'test_create ok'\n")
+
+        result = asyncio.run(DAMLTester().run_tests(tmp_path))
+
+        assert result.success
+        assert result.tests_passed == 1
+
+    def test_process_killed_on_error(self, tmp_path, monkeypatch, fake_daml):
+        """Test that daml test is killed and reaped when reading its output fails"""
+        (tmp_path / "daml.yaml").write_text("name: demo\n")
+        pid_file = tmp_path / "pid"
+        fake_daml(f"echo $$ > {pid_file}\necho 'test_create ok'\nexec sleep 30\n")
+
+        def fail(self, line):
+            raise RuntimeError("parser failed")
+
+        monkeypatch.setattr(daml_tester._TestOutputParser, "feed", fail)
+
+        with pytest.raises(RuntimeError, match="parser failed"):
+            asyncio.run(DAMLTester().run_tests(tmp_path))
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
@@ -0,0 +1,258 @@
+"""
+Tests for DCAP broadcasting
+
+Unit tests for DCAP message construction and UDP delivery, using a local
+UDP listener in place of the multicast group.
+"""
+
+import json
+import socket
+
+import pytest
+
+from canton_mcp_server.core import dcap
+
+
+@pytest.fixture
+def listener():
+    """Local UDP socket standing in for the DCAP multicast group"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(2)
+    yield sock
+    sock.close()
+
+
+def receive(listener):
+    data, _ = listener.recvfrom(65535)
+    return json.loads(data)
+
+
+class TestSendUdp:
+    """Test UDP delivery"""
+
+    def test_sends_message_and_reuses_socket(self, listener):
+        """Test that consecutive sends share one cached socket"""
+        port = listener.getsockname()[1]
+
+        dcap._send_udp("127.0.0.1", port, {"t": "perf_update", "tool": "a"}, "a")
+        sock = dcap._get_sock("127.0.0.1")
+        dcap._send_udp("127.0.0.1", port, {"t": "perf_update", "tool": "b"}, "b")
+
+        assert receive(listener)["tool"] == "a"
+        assert receive(listener)["tool"] == "b"
+        assert dcap._get_sock("127.0.0.1") is sock
+
+    def test_oversized_args_dropped(self, listener):
+        """Test that args are removed when the message exceeds UDP_MAX_SIZE"""
+        port = listener.getsockname()[1]
+        message = {"t": "perf_update", "ctx": {"args": {"blob": "x" * 2000}}}
+
+        dcap._send_udp("127.0.0.1", port, message, "big")
+
+        assert receive(listener)["ctx"]["args"] == {}
+
+    def test_oversized_without_args_encoded_once(self, listener, monkeypatch):
+        """Test that a large message with no args isn't re-encoded"""
+        port = listener.getsockname()[1]
+        message = {"t": "perf_update", "tool": "x" * 2000, "ctx": {"args": {}}}
+        calls = []
+        dumps = dcap.orjson.dumps
+        monkeypatch.setattr(dcap.orjson, "dumps", lambda obj: calls.append(obj) or dumps(obj))
+
+        dcap._send_udp("127.0.0.1", port, message, "big")
+
+        assert receive(listener)["tool"] == "x" * 2000
+        assert len(calls) == 1
+
+
+class TestSendPerfUpdate:
+    """Test perf_update broadcasting"""
+
+    def test_perf_update_sent_in_background(self, listener, monkeypatch):
+        """Test that perf_update is delivered by the background sender"""
+        port = listener.getsockname()[1]
+        monkeypatch.setattr(
+            dcap,
+            "_get_dcap_config",
+            lambda: {"multicast_ip": "127.0.0.1", "port": port, "server_id": "test"},
+        )
+
+        dcap.send_perf_update("my_tool", 12, True, args={"query": "hello"}, cost_paid=5)
+        message = receive(listener)
+
+        assert (message["v"], message["t"], message["sid"]) == (2, "perf_update", "test")
+        assert message["tool"] == "my_tool"
+        assert message["ctx"]["args"] == {"query": "hello"}
+        assert message["cost_paid"] == 5
+
+    def test_args_skipped_when_too_large(self, listener, monkeypatch):
+        """Test that args which can't fit in a datagram are not anonymized"""
+        port = listener.getsockname()[1]
+        monkeypatch.setattr(
+            dcap,
+            "_get_dcap_config",
+            lambda: {"multicast_ip": "127.0.0.1", "port": port, "server_id": "test"},
+        )
+        monkeypatch.setattr(dcap, "anonymize_args", lambda args: pytest.fail("anonymized"))
+
+        dcap.send_perf_update("my_tool", 1, True, args={f"arg_{i}": i for i in range(200)})
+
+        assert receive(listener)["ctx"]["args"] == {}
+
+    def test_many_small_args_kept_when_they_fit(self, listener, monkeypatch):
+        """Test that args are only dropped when the encoded message is too large"""
+        port = listener.getsockname()[1]
+        monkeypatch.setattr(
+            dcap,
+            "_get_dcap_config",
+            lambda: {"multicast_ip": "127.0.0.1", "port": port, "server_id": "test"},
+        )
+        args = {f"arg_{i}": i for i in range(100)}
+
+        dcap.send_perf_update("my_tool", 1, True, args=args)
+        dcap.send_perf_update("my_tool", 1, True, args={"blob": "x" * 2000, **args})
+
+        assert receive(listener)["ctx"]["args"] == args
+        assert receive(listener)["ctx"]["args"] == {**args, "blob": "x" * 20 + "..."}
+
+    def test_disabled_without_multicast_ip(self, monkeypatch):
+        """Test that nothing is queued when DCAP is not configured"""
+        monkeypatch.setattr(dcap, "_get_dcap_config", lambda: None)
+
+        dcap.send_perf_update("my_tool", 1, True)
+
+        assert dcap._DCAP_QUEUE.empty()
+
+
+class TestSemanticDiscover:
+    """Test semantic_discover broadcasting"""
+
+    def test_connector_spliced_into_message(self, listener, monkeypatch):
+        """Test that the cached connector encoding yields a complete message"""
+        port = listener.getsockname()[1]
+        monkeypatch.setattr(
+            dcap,
+            "_get_dcap_config",
+            lambda: {"multicast_ip": "127.0.0.1", "port": port, "server_id": "test"},
+        )
+
+        for tool in ("a", "b"):
+            dcap.send_semantic_discover(tool, "does things", "http://mcp", payment_enabled=True)
+        messages = [receive(listener) for _ in range(2)]
+
+        assert [m["tool"] for m in messages] == ["a", "b"]
+        assert messages[0]["connector"]["endpoint"] == "http://mcp"
+        assert messages[1]["connector"]["auth"]["type"] == "x402"
+        encoded = dcap._encode_connector("http://mcp", True)
+        assert dcap._encode_connector("http://mcp", True) is encoded
+
+
+class TestBatching:
+    """Test perf_batch coalescing"""
+
+    def test_messages_coalesced_into_one_datagram(self, listener):
+        """Test that several messages to one destination share a datagram"""
+        port = listener.getsockname()[1]
+        items = [("127.0.0.1", port, "test", {"tool": f"t{i}"}, f"t{i}") for i in range(3)]
+
+        dcap._send_batch(items)
+        message = receive(listener)
+
+        assert message["t"] == "perf_batch"
+        assert [item["tool"] for item in message["items"]] == ["t0", "t1", "t2"]
+        assert {(item["t"], item["sid"]) for item in message["items"]} == {("perf_update", "test")}
+
+    def test_oversized_batch_split(self, listener):
+        """Test that batches larger than UDP_MAX_SIZE are split"""
+        port = listener.getsockname()[1]
+        messages = [{"t": "perf_update", "tool": f"t{i}", "pad": "x" * 600} for i in range(4)]
+
+        dcap._send_perf_batch("127.0.0.1", port, messages)
+        received = [receive(listener) for _ in range(2)]
+
+        assert [len(m["items"]) for m in received] == [2, 2]
+
+
+class TestConfigCache:
+    """Test DCAP configuration caching"""
+
+    def test_config_read_once_until_reload(self, monkeypatch):
+        """Test that the environment is only consulted again after a reload"""
+        from canton_mcp_server import env
+
+        dcap.dcap_reload_config()
+        monkeypatch.setitem(env.ENV_VALUES, "DCAP_MULTICAST_IP", "")
+        assert dcap._get_dcap_config() is None
+
+        monkeypatch.setitem(env.ENV_VALUES, "DCAP_MULTICAST_IP", "127.0.0.1")
+        assert dcap._get_dcap_config() is None
+
+        dcap.dcap_reload_config()
+        assert dcap._get_dcap_config()["multicast_ip"] == "127.0.0.1"
+        dcap.dcap_reload_config()
+
+    def test_batch_flag_cached(self, monkeypatch):
+        """Test that the worker's batching switch comes from the cached config"""
+        from canton_mcp_server import env
+
+        dcap.dcap_reload_config()
+        monkeypatch.setitem(env.ENV_VALUES, "DCAP_MULTICAST_IP", "127.0.0.1")
+        monkeypatch.setitem(env.ENV_VALUES, "DCAP_BATCH", "true")
+        assert dcap._batching_enabled() is True
+
+        monkeypatch.setitem(env.ENV_VALUES, "DCAP_BATCH", "false")
+        assert dcap._batching_enabled() is True
+        dcap.dcap_reload_config()
+        assert dcap._batching_enabled() is False
+        dcap.dcap_reload_config()
+
+    def test_enabled_flag_cached(self, monkeypatch):
+        """Test that is_dcap_enabled caches its result"""
+        from canton_mcp_server import env
+
+        dcap.dcap_reload_config()
+        monkeypatch.setitem(env.ENV_VALUES, "DCAP_ENABLED", "false")
+        assert dcap.is_dcap_enabled() is False
+
+        monkeypatch.setitem(env.ENV_VALUES, "DCAP_ENABLED", "true")
+        assert dcap.is_dcap_enabled() is False
+        dcap.dcap_reload_config()
+        assert dcap.is_dcap_enabled() is True
+        dcap.dcap_reload_config()
+
+
+class TestAnonymizeArgs:
+    """Test argument anonymization"""
+
+    def test_values_anonymized_by_type(self):
+        """Test that each supported type is summarized as before"""
+        args = {
+            "text": "x" * 25,
+            "short": "hi",
+            "count": 3,
+            "ratio": 0.5,
+            "flag": True,
+            "items": [1, 2],
+            "fields": {"a": 1},
+            "nothing": None,
+            "other": object,
+        }
+
+        assert dcap.anonymize_args(args) == {
+            "text": "x" * 20 + "...",
+            "short": "hi",
+            "count": 3,
+            "ratio": 0.5,
+            "flag": True,
+            "items": "[2 items]",
+            "fields": "{1 fields}",
+            "nothing": None,
+            "other": str(object)[:20],
+        }
+
+    def test_subclasses_use_base_handler(self):
+        """Test that subclasses of supported types are not stringified"""
+        from collections import OrderedDict
+
+        assert dcap.anonymize_args({"d": OrderedDict(a=1, b=2)}) == {"d": "{2 fields}"}
@@ -0,0 +1,408 @@
+"""
+Tests for DirectFileResourceLoader
+
+Unit tests for canonical repository scanning and commit-hash tracking.
+"""
+
+import subprocess
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from canton_mcp_server.core import direct_file_loader
+from canton_mcp_server.core.direct_file_loader import (
+    CanonicalRepoFileHandler,
+    DirectFileResourceLoader,
+)
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def canonical_docs(tmp_path, monkeypatch):
+    """Create a canonical docs directory with a single git repository"""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+
+    docs = tmp_path / "canonical-daml-docs"
+    repo = docs / "daml"
+    repo.mkdir(parents=True)
+    _git(repo, "init", "-q")
+    (repo / "README.md").write_text("# DAML\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "initial")
+    return docs
+
+
+class TestCommitHashes:
+    """Test commit hash lookups"""
+
+    def test_commit_hash_memoized_when_refs_unchanged(self, canonical_docs, monkeypatch):
+        """Test that unchanged refs don't re-run git"""
+        loader = DirectFileResourceLoader(canonical_docs)
+        first = loader.get_commit_hashes_fast()
+        assert len(first["daml"]) == 40
+
+        def fail(*args, **kwargs):
+            raise AssertionError("git should not be invoked for unchanged refs")
+
+        monkeypatch.setattr(loader, "_get_current_commit_hash", fail)
+        assert loader.get_commit_hashes_fast() == first
+
+    def test_reload_check_skips_git_when_refs_unchanged(self, canonical_docs, monkeypatch):
+        """Test that a file event without a new commit only stats the refs"""
+        loader = DirectFileResourceLoader(canonical_docs)
+        loader.scan_repositories()
+        (canonical_docs / "daml" / "README.md").write_text("# edited\n")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("git should not be invoked for unchanged refs")
+
+        monkeypatch.setattr(loader, "_get_current_commit_hash", fail)
+        monkeypatch.setattr(loader, "scan_repositories", fail)
+        loader._check_and_reload_on_commit_change()
+
+    def test_head_read_without_git(self, canonical_docs):
+        """Test that HEAD is resolved from loose refs, packed refs and detached HEADs"""
+        repo = canonical_docs / "daml"
+        expected = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True
+        ).stdout.strip()
+        loader = DirectFileResourceLoader(canonical_docs)
+
+        assert loader._read_head_commit(repo) == expected
+        _git(repo, "pack-refs", "--all")
+        assert loader._read_head_commit(repo) == expected
+        _git(repo, "checkout", "-q", "--detach")
+        assert loader._read_head_commit(repo) == expected
+
+    def test_head_read_falls_back_to_git(self, tmp_path, canonical_docs, monkeypatch):
+        """Test that repositories without a .git directory are resolved by git"""
+        monkeypatch.setattr(direct_file_loader, "_PYGIT2_AVAILABLE", False)
+        repo = canonical_docs / "daml"
+        worktree = tmp_path / "worktree"
+        _git(repo, "worktree", "add", "-q", "--detach", str(worktree))
+        loader = DirectFileResourceLoader(canonical_docs)
+
+        assert loader._read_head_commit(tmp_path) is None
+        assert loader._read_head_commit(worktree) is None
+        assert loader._get_current_commit_hash(worktree) == loader._read_head_commit(repo)
+
+    def test_pygit2_matches_git(self, tmp_path, canonical_docs):
+        """Test that in-process lookups agree with the git CLI, including worktrees"""
+        pytest.importorskip("pygit2")
+        repo = canonical_docs / "daml"
+        worktree = tmp_path / "worktree"
+        _git(repo, "worktree", "add", "-q", "--detach", str(worktree))
+        expected = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True
+        ).stdout.strip()
+        loader = DirectFileResourceLoader(canonical_docs)
+
+        assert loader._read_head_commit(worktree) is None
+        assert loader._get_current_commit_hash(worktree) == expected
+        assert list(loader._get_blob_hash_index_pygit2(repo, expected)) == ["README.md"]
+
+    def test_commit_hash_refreshed_after_new_commit(self, canonical_docs):
+        """Test that a new commit invalidates the memoized hash"""
+        loader = DirectFileResourceLoader(canonical_docs)
+        first = loader.get_commit_hashes_fast()["daml"]
+
+        repo = canonical_docs / "daml"
+        (repo / "guide.md").write_text("# Guide\n")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-q", "-m", "second")
+
+        second = loader.get_commit_hashes_fast()["daml"]
+        assert second != first
+
+
+class TestDocumentationFilter:
+    """Test documentation file classification"""
+
+    def test_extensions_and_special_names(self, canonical_docs):
+        """Test that doc files are accepted and build/binary/unknown files rejected"""
+        loader = DirectFileResourceLoader(canonical_docs)
+
+        accepted = ["guide.MD", "Main.daml", "daml.yaml", "README", "LICENSE"]
+        rejected = ["setup.py", "logo.png", "Makefile", "Dockerfile", "data.csv"]
+
+        assert all(loader._is_documentation_file(Path(name)) for name in accepted)
+        assert not any(loader._is_documentation_file(Path(name)) for name in rejected)
+
+    def test_name_check_matches_path_suffix_rules(self, canonical_docs):
+        """Test that string-based classification treats dots like Path.suffix"""
+        loader = DirectFileResourceLoader(canonical_docs)
+        expected = {
+            "notes.md": True,
+            "a.b.rst": True,
+            "archive.tar.gz": False,
+            ".md": False,  # dotfile, no extension
+            "readme.": False,  # trailing dot, no extension, not "readme"
+            "README": True,
+        }
+
+        assert {name: loader._is_documentation_name(name) for name in expected} == expected
+
+class TestCategorizeResource:
+    """Test resource categorization"""
+
+    def test_first_matching_category_wins(self, canonical_docs):
+        """Test that file path keywords map to resource types in priority order"""
+        loader = DirectFileResourceLoader(canonical_docs)
+
+        def category(path):
+            return loader._categorize_resource({"file_path": path})
+
+        assert category("docs/Examples/intro.md") == "patterns"
+        assert category("docs/anti-pattern.md") == "patterns"
+        assert category("rules/bad/template.md") == "patterns"
+        assert category("docs/avoid-this.md") == "anti_patterns"
+        assert category("docs/Policy.rst") == "rules"
+        assert category("docs/intro.md") == "docs"
+
+
+class TestScanRepositories:
+    """Test repository scanning"""
+
+    def test_scan_uses_git_blob_hashes(self, canonical_docs):
+        """Test that scanned resources carry the blob hash git reports"""
+        repo = canonical_docs / "daml"
+        expected = subprocess.run(
+            ["git", "hash-object", "README.md"],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+        loader = DirectFileResourceLoader(canonical_docs)
+        resources = loader.scan_repositories(force_refresh=True)
+
+        docs = {r["file_path"]: r for r in resources["docs"]}
+        assert docs["README.md"]["canonical_hash"] == expected
+        assert docs["README.md"]["content"] == "# DAML\n"
+
+    def test_scan_skips_untracked_files(self, canonical_docs):
+        """Test that files not committed to git are not served"""
+        (canonical_docs / "daml" / "notes.md").write_text("scratch\n")
+
+        loader = DirectFileResourceLoader(canonical_docs)
+        resources = loader.scan_repositories(force_refresh=True)
+
+        paths = {r["file_path"] for rs in resources.values() for r in rs}
+        assert paths == {"README.md"}
+
+    def test_scan_enumerates_tracked_files_only(self, canonical_docs, monkeypatch):
+        """Test that tracked files are found without walking the working tree"""
+        repo = canonical_docs / "daml"
+        (repo / "docs").mkdir()
+        (repo / "docs" / "guide.rst").write_text("Guide\n")
+        (repo / "build.py").write_text("print()\n")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-q", "-m", "docs")
+        (repo / "README.md").unlink()
+
+        def fail(self, pattern):
+            raise AssertionError("working tree should not be walked")
+
+        monkeypatch.setattr(type(repo), "rglob", fail)
+        loader = DirectFileResourceLoader(canonical_docs)
+        resources = loader.scan_repositories(force_refresh=True)
+
+        paths = {r["file_path"] for rs in resources.values() for r in rs}
+        assert paths == {"docs/guide.rst"}
+
+    def test_scan_merges_repositories_in_order(self, canonical_docs):
+        """Test that concurrently scanned repositories are merged in repo order"""
+        repo = canonical_docs / "canton"
+        repo.mkdir()
+        _git(repo, "init", "-q")
+        (repo / "README.md").write_text("# Canton\n")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-q", "-m", "initial")
+
+        loader = DirectFileResourceLoader(canonical_docs)
+        resources = loader.scan_repositories(force_refresh=True)
+
+        assert [r["source_repo"] for r in resources["docs"]] == ["daml", "canton"]
+
+    def test_scan_without_git_prunes_vcs_and_build_dirs(self, tmp_path, monkeypatch):
+        """Test that the working-tree fallback skips .git and build directories"""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        repo = tmp_path / "docs" / "daml"
+        for directory in ("guides", ".git", "node_modules/pkg", "build", "__pycache__"):
+            (repo / directory).mkdir(parents=True)
+            (repo / directory / "index.md").write_text("# Index\n")
+        (repo / "guides" / "logo.png").write_bytes(b"\x89PNG")
+
+        loader = DirectFileResourceLoader(tmp_path / "docs")
+        resources = loader._scan_repository(repo, "daml", "unknown")
+
+        assert [r["file_path"] for r in resources] == ["guides/index.md"]
+        assert list(loader._walk_working_tree(repo)) == [repo / "guides" / "index.md"]
+
+    def test_scan_without_git_computes_blob_hashes(self, tmp_path, monkeypatch):
+        """Test that files outside git get the blob hash git would assign"""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        repo = tmp_path / "docs" / "daml"
+        repo.mkdir(parents=True)
+        (repo / "README.md").write_text("# DAML\n")
+        expected = subprocess.run(
+            ["git", "hash-object", "README.md"],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+        loader = DirectFileResourceLoader(tmp_path / "docs")
+        resources = loader._scan_repository(repo, "daml", "unknown")
+
+        assert resources[0]["canonical_hash"] == expected
+
+    def test_scan_skips_binary_content(self, tmp_path, monkeypatch):
+        """Test that files with NUL bytes are rejected, while large text files are read whole"""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        repo = tmp_path / "docs" / "daml"
+        repo.mkdir(parents=True)
+        (repo / "README").write_bytes(b"\x00\x01" + b"x" * 10_000)
+        (repo / "guide.md").write_text("line\n" * 2000)
+
+        loader = DirectFileResourceLoader(tmp_path / "docs")
+        resources = loader._scan_repository(repo, "daml", "unknown")
+
+        assert [r["file_path"] for r in resources] == ["guide.md"]
+        assert resources[0]["content"] == "line\n" * 2000
+
+    def test_rescan_reuses_unchanged_files(self, canonical_docs, monkeypatch):
+        """Test that a rescan after a new commit only reads changed files"""
+        repo = canonical_docs / "daml"
+        loader = DirectFileResourceLoader(canonical_docs)
+        loader.scan_repositories(force_refresh=True)
+
+        (repo / "guide.md").write_text("# Guide\n")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-q", "-m", "guide")
+
+        created = []
+        original = loader._create_file_resource
+
+        def counting(file_path, *args):
+            created.append(file_path.name)
+            return original(file_path, *args)
+
+        monkeypatch.setattr(loader, "_create_file_resource", counting)
+        resources = loader.scan_repositories(force_refresh=True)
+
+        head = loader.get_commit_hashes_fast()["daml"]
+        assert created == ["guide.md"]
+        assert {r["file_path"] for r in resources["docs"]} == {"README.md", "guide.md"}
+        assert {r["source_commit"] for r in resources["docs"]} == {head}
+
+    def test_get_resource_by_name(self, canonical_docs):
+        """Test lookups by resource type and name"""
+        loader = DirectFileResourceLoader(canonical_docs)
+
+        assert loader.get_resource_by_name("daml-readme", "docs")["file_path"] == "README.md"
+        assert loader.get_resource_by_name("daml-readme", "rules") is None
+        assert loader.get_resource_by_name("missing", "docs") is None
+
+    def test_scan_reuses_resolved_commit_hash(self, canonical_docs, monkeypatch):
+        """Test that a full scan resolves HEAD once per repository"""
+        loader = DirectFileResourceLoader(canonical_docs)
+        calls = []
+        original = loader._get_current_commit_hash
+
+        def counting(repo_path):
+            calls.append(repo_path)
+            return original(repo_path)
+
+        monkeypatch.setattr(loader, "_get_current_commit_hash", counting)
+        resources = loader.scan_repositories(force_refresh=True)
+
+        assert len(calls) == 1
+        assert resources["docs"][0]["source_commit"] == loader.get_commit_hashes_fast()["daml"]
+
+    def test_blob_index_reused_at_same_commit(self, canonical_docs, monkeypatch):
+        """Test that a forced rescan without a new commit doesn't list the tree again"""
+        loader = DirectFileResourceLoader(canonical_docs)
+        calls = []
+        original = loader._list_blob_hashes
+
+        def counting(repo_path, commit_hash):
+            calls.append(commit_hash)
+            return original(repo_path, commit_hash)
+
+        monkeypatch.setattr(loader, "_list_blob_hashes", counting)
+        loader.scan_repositories(force_refresh=True)
+        loader.scan_repositories(force_refresh=True)
+        assert len(calls) == 1
+
+        repo = canonical_docs / "daml"
+        (repo / "guide.md").write_text("# Guide\n")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-q", "-m", "guide")
+        resources = loader.scan_repositories(force_refresh=True)
+
+        assert len(calls) == 2
+        assert {r["file_path"] for r in resources["docs"]} == {"README.md", "guide.md"}
+
+
+class TestDiskCache:
+    """Test the on-disk resource cache"""
+
+    def test_cache_round_trip(self, canonical_docs, monkeypatch):
+        """Test that a fresh loader is served from the compressed disk cache"""
+        resources = DirectFileResourceLoader(canonical_docs).scan_repositories(force_refresh=True)
+
+        loader = DirectFileResourceLoader(canonical_docs)
+        cache_files = list(loader.cache_dir.glob("resource-cache-*"))
+        assert [f.suffixes[-2:] for f in cache_files] == [[".json", ".gz"]]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("repository should not be rescanned")
+
+        monkeypatch.setattr(loader, "_scan_repository", fail)
+        assert loader.scan_repositories() == resources
+
+    def test_scan_time_stored_once(self, canonical_docs):
+        """Test that the scan time lives on the loader/cache, not on each resource"""
+        scanner = DirectFileResourceLoader(canonical_docs)
+        resources = scanner.scan_repositories(force_refresh=True)
+        assert not {"created_at", "updated_at", "extracted_at"} & resources["docs"][0].keys()
+        assert scanner.scanned_at.endswith("Z")
+
+        loader = DirectFileResourceLoader(canonical_docs)
+        loader.scan_repositories()
+        assert loader.scanned_at == scanner.scanned_at
+
+
+class TestHotReloadDebounce:
+    """Test debouncing of file system events"""
+
+    def test_burst_triggers_one_check_after_last_event(self):
+        """Test that a burst of events runs a single trailing check"""
+        checks = []
+        loader = SimpleNamespace(
+            _check_and_reload_on_commit_change=lambda: checks.append(time.monotonic())
+        )
+        handler = CanonicalRepoFileHandler(loader)
+        handler.check_delay = 0.05
+
+        for i in range(5):
+            handler.on_any_event(SimpleNamespace(is_directory=False, src_path=f"/repo/doc{i}.md"))
+        last_event = time.monotonic()
+        handler.on_any_event(SimpleNamespace(is_directory=False, src_path="/repo/.git/index"))
+
+        time.sleep(0.3)
+        assert len(checks) == 1
+        assert checks[0] > last_event